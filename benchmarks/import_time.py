@@ -0,0 +1,84 @@
+"""Import-time benchmark for the weather_client package.
+
+Runs `python -X importtime` in fresh interpreters and fails when the median
+cumulative import time of a module exceeds its threshold, or when importing it
+pulls in the HTTP stack.
+
+Usage:
+    python benchmarks/import_time.py [--runs 7] [--threshold-ms 15]
+"""
+import argparse
+import os
+import statistics
+import subprocess  # noqa: S404
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BENCHMARKED_MODULES = (
+    'weather_client',
+    'weather_client.weather_data_classes',
+)
+FORBIDDEN_MODULES = ('requests', 'urllib3')
+
+
+def measure_import(module_name: str) -> tuple[int, set[str]]:
+    """
+    Import a module in a fresh interpreter.
+
+    Args:
+        module_name (str): The module to import.
+
+    Returns:
+        tuple[int, set[str]]: The cumulative import time in microseconds and the imported module names.
+    """
+    completed = subprocess.run(  # noqa: S603
+        [sys.executable, '-X', 'importtime', '-c', 'import {0}'.format(module_name)],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=ROOT_DIR,
+    )
+    cumulative_us = 0
+    imported_modules = set()
+    for line in completed.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, imported_name = line[len('import time:'):].split('|')
+        imported_modules.add(imported_name.strip())
+        if imported_name.strip() == module_name:
+            cumulative_us = int(cumulative)
+    return cumulative_us, imported_modules
+
+
+def main() -> int:
+    """Run the benchmark and return the process exit code."""
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument('--runs', type=int, default=7)
+    arg_parser.add_argument('--threshold-ms', type=float, default=15)
+    args = arg_parser.parse_args()
+
+    failed = False
+    for module_name in BENCHMARKED_MODULES:
+        timings = []
+        imported_modules: set[str] = set()
+        for _ in range(args.runs):
+            cumulative_us, imported_modules = measure_import(module_name)
+            timings.append(cumulative_us / 1000)
+        median_ms = statistics.median(timings)
+        leaked = sorted(set(FORBIDDEN_MODULES) & imported_modules)
+        status = 'ok'
+        if median_ms > args.threshold_ms or leaked:
+            status = 'FAIL'
+            failed = True
+        print('{0:<40} median {1:7.2f} ms  min {2:7.2f} ms  {3}{4}'.format(
+            module_name,
+            median_ms,
+            min(timings),
+            status,
+            ' (imports {0})'.format(', '.join(leaked)) if leaked else '',
+        ))
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,180 @@
+"""Tests for the weather-client command-line tool."""
+import csv
+import io
+import json
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from weather_client import cli
+from weather_client.exceptions import WeatherAPIEndpointError
+from weather_client.weather_api_client import WeatherAPIClient
+from weather_client.weather_api_endpoints import BaseWeatherAPIEndpoint
+from weather_client.weather_data_classes import ForecastResult, WeatherResult
+
+
+class FakeWeatherEndpoint(object):
+    """Returns a result for known cities and records the requested ones."""
+
+    def __init__(self, requested: list[str]) -> None:
+        self.requested = requested
+
+    def get_current_weather(self, city_name: str) -> WeatherResult:
+        self.requested.append(city_name)
+        if city_name == 'Nowhere':
+            raise WeatherAPIEndpointError('No matching location found.')
+        return WeatherResult(city_name, 2.5, 'Clear', '2024-01-09 23:30')
+
+
+class FakeForecastEndpoint(object):
+    """Returns a fixed forecast."""
+
+    def get_forecast(self, city_name: str) -> ForecastResult:
+        return ForecastResult(city_name, 3, 1, 5, 'Cloudy', 20, 0, '2024-01-10')
+
+
+@pytest.fixture
+def requested(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    requested_cities: list[str] = []
+
+    def make_client(api_key: str) -> WeatherAPIClient:
+        client = WeatherAPIClient(api_key)
+        client.weather = FakeWeatherEndpoint(requested_cities)  # type: ignore[assignment]
+        client.forecast = FakeForecastEndpoint()  # type: ignore[assignment]
+        return client
+
+    monkeypatch.setattr(cli, 'WeatherAPIClient', make_client)
+    return requested_cities
+
+
+def _cities_file(tmp_path: Path, *city_names: str) -> str:
+    cities_path = tmp_path / 'cities.txt'
+    cities_path.write_text('\n'.join(city_names) + '\n', encoding='utf-8')
+    return str(cities_path)
+
+
+def test_jsonl_rows_and_summary(tmp_path: Path, requested: list[str], capsys: pytest.CaptureFixture) -> None:
+    cities_path = _cities_file(tmp_path, 'London', '# comment', '', 'Nowhere', 'Paris')
+
+    exit_code = cli.main([cities_path, '--api-key', 'key', '--workers', '2'])
+
+    captured = capsys.readouterr()
+    rows = {row['city_name']: row for row in map(json.loads, captured.out.splitlines())}
+    assert exit_code == 1
+    assert sorted(requested) == ['London', 'Nowhere', 'Paris']
+    assert rows['London'] == {
+        'city_name': 'London',
+        'temperature': 2.5,
+        'condition': 'Clear',
+        'last_updated': '2024-01-09 23:30',
+        'source': 'api',
+        'error': '',
+    }
+    assert rows['Nowhere']['error'] == 'No matching location found.'
+    assert 'cities: 3, requested: 3, cached: 0, errors: 1' in captured.err
+
+
+def test_csv_forecast_output(tmp_path: Path, requested: list[str], capsys: pytest.CaptureFixture) -> None:
+    output_path = tmp_path / 'forecast.csv'
+
+    exit_code = cli.main([
+        _cities_file(tmp_path, 'Kyiv'), '--api-key', 'key', '--kind', 'forecast', '--format', 'csv',
+        '--output', str(output_path), '--quiet',
+    ])
+
+    with open(output_path, encoding='utf-8', newline='') as csv_file:
+        rows = list(csv.DictReader(csv_file))
+    assert exit_code == 0
+    assert capsys.readouterr().err == ''
+    assert rows == [{
+        'city_name': 'Kyiv', 'avg_temp': '3', 'min_temp': '1', 'max_temp': '5', 'condition': 'Cloudy',
+        'chance_of_rain': '20', 'chance_of_snow': '0', 'date': '2024-01-10', 'source': 'api', 'error': '',
+    }]
+
+
+def test_fresh_cache_entries_skip_requests(
+        tmp_path: Path,
+        requested: list[str],
+        capsys: pytest.CaptureFixture,
+) -> None:
+    args = [_cities_file(tmp_path, 'London', 'Paris'), '--api-key', 'key', '--cache-dir', str(tmp_path / 'cache')]
+    cli.main(args)
+    capsys.readouterr()
+    requested.clear()
+
+    cli.main(args)
+
+    captured = capsys.readouterr()
+    assert requested == []
+    assert {json.loads(line)['source'] for line in captured.out.splitlines()} == {'cache'}
+    assert 'cities: 2, requested: 0, cached: 2, errors: 0' in captured.err
+
+
+def test_stale_cache_entries_are_requested(tmp_path: Path, requested: list[str], capsys: pytest.CaptureFixture) -> None:
+    cache = cli.ResultCache(str(tmp_path / 'cache'), max_age=60)
+    cache.set('current', 'London', {'city_name': 'London'})
+    stale_time = time.time() - 120
+    os.utime(cache._path('current', 'London'), (stale_time, stale_time))
+
+    cli.main([_cities_file(tmp_path, 'London'), '--api-key', 'key', '--cache-dir', cache.cache_dir, '--max-age', '60'])
+
+    assert requested == ['London']
+    assert json.loads(capsys.readouterr().out)['source'] == 'api'
+
+
+def test_unwritable_cache_is_not_fatal(tmp_path: Path, requested: list[str], capsys: pytest.CaptureFixture) -> None:
+    cache_file = tmp_path / 'cache'
+    cache_file.write_text('not a directory')
+
+    exit_code = cli.main([_cities_file(tmp_path, 'London'), '--api-key', 'key', '--cache-dir', str(cache_file)])
+
+    assert exit_code == 0
+    assert json.loads(capsys.readouterr().out)['temperature'] == 2.5
+
+
+def test_rate_limiter_spaces_calls() -> None:
+    rate_limiter = cli.RateLimiter(rate=20)
+
+    started = time.monotonic()
+    for _ in range(5):
+        rate_limiter.wait()
+
+    assert time.monotonic() - started >= 0.19
+
+
+def test_read_cities_skips_blanks_and_comments() -> None:
+    assert list(cli.read_cities(io.StringIO(' London \n\n# skip\nParis\n'))) == ['London', 'Paris']
+
+
+def test_connection_error_does_not_leak_api_key(
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture,
+) -> None:
+    monkeypatch.setattr(BaseWeatherAPIEndpoint, 'base_url', 'http://127.0.0.1:9/')
+
+    exit_code = cli.main([_cities_file(tmp_path, 'Paris'), '--api-key', 'secret-key', '--format', 'csv', '--quiet'])
+
+    output = capsys.readouterr().out
+    assert exit_code == 1
+    assert 'Paris' in output
+    assert 'secret-key' not in output
+    assert 'key=***' in output
+
+
+def test_missing_input_file_exits_cleanly(tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+    with pytest.raises(SystemExit) as exit_info:
+        cli.main([str(tmp_path / 'missing.txt'), '--api-key', 'key'])
+
+    assert exit_info.value.code == 2
+    assert 'missing.txt' in capsys.readouterr().err
+
+
+def test_redact_api_key() -> None:
+    message = "Max retries exceeded with url: /v1/current.json?key=abc123&q=Paris ('abc123')"
+
+    assert cli.redact_api_key(message, 'abc123') == (
+        "Max retries exceeded with url: /v1/current.json?key=***&q=Paris ('***')"
+    )
@@ -0,0 +1,64 @@
+"""Tests for the bulk data parser."""
+import json
+
+import pytest
+
+from weather_client.data_parsers import BulkDataParser, ForecastDataParser, WeatherDataParser
+from weather_client.exceptions import DataParserError
+from weather_client.weather_data_classes import WeatherResult
+
+
+def _weather_document(city_name: str, temperature: float = 2.0) -> bytes:
+    return json.dumps({
+        'location': {'name': city_name},
+        'current': {'temp_c': temperature, 'condition': {'text': 'Clear'}, 'last_updated': '2024-01-09 23:30'},
+    }).encode()
+
+
+def test_in_process_and_pooled_paths_match() -> None:
+    raw_documents = [_weather_document('City{0}'.format(index), index) for index in range(50)]
+    in_process = BulkDataParser(WeatherDataParser, max_workers=1)
+    pooled = BulkDataParser(WeatherDataParser, max_workers=2, chunk_size=7, min_pool_batch_size=10)
+
+    rows = pooled.parse_rows(raw_documents)
+
+    assert rows == in_process.parse_rows(raw_documents)
+    assert rows[3] == ('City3', 3, 'Clear', '2024-01-09 23:30')
+
+
+def test_parse_columns_on_empty_batch() -> None:
+    columns = BulkDataParser(WeatherDataParser).parse_columns([])
+
+    assert columns == {'city_name': [], 'temperature': [], 'condition': [], 'last_updated': []}
+
+
+def test_parse_objects() -> None:
+    weather_results = BulkDataParser(WeatherDataParser).parse_objects([_weather_document('London')])
+
+    assert isinstance(weather_results[0], WeatherResult)
+    assert weather_results[0].city_name == 'London'
+
+
+@pytest.mark.parametrize('raw_document', [b'not json', b'[]', b'{"location": []}'])
+def test_malformed_document_raises_parser_error(raw_document: bytes) -> None:
+    with pytest.raises(DataParserError):
+        BulkDataParser(WeatherDataParser).parse_rows([raw_document])
+
+
+def test_malformed_forecast_document_raises_parser_error() -> None:
+    raw_document = b'{"location": {"name": "X"}, "forecast": {"forecastday": []}}'
+    with pytest.raises(DataParserError):
+        BulkDataParser(ForecastDataParser).parse_rows([raw_document])
+
+
+def test_skip_invalid_drops_bad_documents_in_pool() -> None:
+    raw_documents = [_weather_document('City{0}'.format(index)) for index in range(20)]
+    raw_documents[5] = b'{"location": []}'
+    bulk_parser = BulkDataParser(
+        WeatherDataParser, max_workers=2, chunk_size=4, min_pool_batch_size=10, skip_invalid=True,
+    )
+
+    rows = bulk_parser.parse_rows(raw_documents)
+
+    assert len(rows) == 19
+    assert 'City5' not in {row[0] for row in rows}
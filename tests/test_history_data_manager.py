@@ -0,0 +1,212 @@
+"""Tests for the results history store."""
+import os
+import zlib
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from weather_client import WeatherAPIClient, WeatherService
+from weather_client.exceptions import WeatherAPIDataManagerError
+from weather_client.weather_data_classes import ForecastResult, WeatherResult
+from weather_client.weather_data_managers import ForecastHistoryManager, WeatherHistoryManager
+
+
+def _stored_files(root_dir: Path) -> list[str]:
+    return sorted(file_name for _, _, file_names in os.walk(root_dir) for file_name in file_names)
+
+
+def _weather(temperature: float, last_updated: str, condition: str = 'Clear') -> WeatherResult:
+    return WeatherResult('London', temperature, condition, last_updated)
+
+
+def _history_with_two_months(root_dir: Path) -> WeatherHistoryManager:
+    history = WeatherHistoryManager(str(root_dir))
+    for weather_result in (
+        _weather(1, '2024-01-30 10:00'),
+        _weather(2, '2024-01-31 23:45'),
+        _weather(3, '2024-02-01 00:00'),
+        _weather(4, '2024-02-10 12:00'),
+    ):
+        history.append(weather_result)
+    history.flush()
+    return history
+
+
+def _count_members(chunk_path: Path) -> int:
+    members = 0
+    with open(chunk_path, 'rb') as chunk_file:
+        raw_data = chunk_file.read()
+    while raw_data:
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        decompressor.decompress(raw_data)
+        raw_data = decompressor.unused_data
+        members += 1
+    return members
+
+
+def test_service_close_flushes_history(tmp_path: Path) -> None:
+    history_dir = tmp_path / 'history'
+    service = WeatherService(WeatherAPIClient('key'), history_dir=str(history_dir))
+    service.weather_data.save(WeatherResult('London', 2.0, 'Clear', '2024-01-09 23:30'))
+    service.weather_data.save(WeatherResult('Paris', 5.0, 'Rain', '2024-01-09 23:30'))
+    assert not _stored_files(history_dir)
+
+    service.close()
+
+    assert len(_stored_files(history_dir)) == 2
+    assert WeatherHistoryManager(str(history_dir / 'weather')).get_range('paris')[0].temperature == 5.0
+
+
+def test_history_flushes_after_interval(tmp_path: Path) -> None:
+    history = WeatherHistoryManager(str(tmp_path))
+    history.flush_interval = 0
+
+    history.append(WeatherResult('London', 2.0, 'Clear', '2024-01-09 23:30'))
+
+    assert _stored_files(tmp_path)
+
+
+def test_result_without_timestamp_is_saved_but_not_recorded(tmp_path: Path) -> None:
+    service = WeatherService(WeatherAPIClient('key'), history_dir=str(tmp_path))
+
+    saved_result = service.weather_data.save(WeatherResult('Paris', 12, 'Sunny', ''))
+    service.close()
+
+    assert saved_result is not None
+    assert service.weather_history is not None
+    assert service.weather_history.get_range('Paris') == []
+
+
+def test_invalid_timestamp_does_not_touch_storage(tmp_path: Path) -> None:
+    service = WeatherService(WeatherAPIClient('key'), history_dir=str(tmp_path))
+
+    with pytest.raises(WeatherAPIDataManagerError):
+        service.weather_data.save(WeatherResult('Paris', 12, 'Sunny', 'yesterday'))
+
+    assert service.weather_data.count() == 0
+
+
+def test_service_applies_history_retention_on_close(tmp_path: Path) -> None:
+    service = WeatherService(WeatherAPIClient('key'), history_dir=str(tmp_path), history_retention=timedelta(days=30))
+    with service:
+        service.weather_data.save(WeatherResult('London', 2.0, 'Clear', '2020-01-09 23:30'))
+        service.weather_data.save(WeatherResult('London', 2.0, 'Clear', datetime.now().strftime('%Y-%m-%d %H:%M')))
+
+    assert len(_stored_files(tmp_path)) == 1
+
+
+def test_get_range_bounds_are_inclusive(tmp_path: Path) -> None:
+    history = _history_with_two_months(tmp_path)
+
+    in_range = history.get_range('London', start=datetime(2024, 1, 31, 23, 45), end=datetime(2024, 2, 1))
+
+    assert [weather_result.temperature for weather_result in in_range] == [2, 3]
+    assert [weather_result.temperature for weather_result in history.get_range('London')] == [1, 2, 3, 4]
+    january = history.get_range('London', end=datetime(2024, 1, 31))
+    assert [weather_result.temperature for weather_result in january] == [1]
+
+
+def test_get_range_only_opens_overlapping_chunks(tmp_path: Path) -> None:
+    history = _history_with_two_months(tmp_path)
+    (tmp_path / 'london' / '2024-01.jsonl.gz').write_bytes(b'not gzip')
+
+    february = history.get_range('London', start=datetime(2024, 2, 1))
+
+    assert [weather_result.temperature for weather_result in february] == [3, 4]
+
+
+def test_stray_files_in_city_directory_are_ignored(tmp_path: Path) -> None:
+    history = _history_with_two_months(tmp_path)
+    (tmp_path / 'london' / 'backup.jsonl.gz').write_bytes(b'')
+    (tmp_path / 'london' / 'notes.txt').write_text('notes')
+
+    assert len(history.get_range('London')) == 4
+    assert history.apply_retention(timedelta(days=1), now=datetime(2030, 1, 1)) == 2
+
+
+def test_downsample_averages_numeric_fields_per_bucket(tmp_path: Path) -> None:
+    history = WeatherHistoryManager(str(tmp_path))
+    for weather_result in (
+        _weather(1, '2024-01-01 00:00', 'Clear'),
+        _weather(3, '2024-01-01 05:59', 'Rain'),
+        _weather(10, '2024-01-01 06:00', 'Snow'),
+        _weather(20, '2024-01-01 13:00', 'Fog'),
+    ):
+        history.append(weather_result)
+
+    buckets = history.downsample('London', timedelta(hours=6))
+
+    assert [(bucket.last_updated, bucket.temperature, bucket.condition) for bucket in buckets] == [
+        ('2024-01-01 00:00', 2, 'Rain'),
+        ('2024-01-01 06:00', 10, 'Snow'),
+        ('2024-01-01 12:00', 20, 'Fog'),
+    ]
+    assert buckets[0].city_name == 'London'
+
+
+def test_downsample_rejects_non_positive_interval(tmp_path: Path) -> None:
+    with pytest.raises(WeatherAPIDataManagerError):
+        WeatherHistoryManager(str(tmp_path)).downsample('London', timedelta(0))
+
+
+def test_forecast_downsample_by_week(tmp_path: Path) -> None:
+    history = ForecastHistoryManager(str(tmp_path))
+    for day, avg_temp in ((1, 2), (2, 4), (8, 10)):
+        history.append(ForecastResult('Paris', avg_temp, 0, 12, 'Cloudy', 10, 0, '2024-01-{0:02d}'.format(day)))
+
+    weeks = history.downsample('Paris', timedelta(days=7), start=datetime(2024, 1, 1))
+
+    assert [week.avg_temp for week in weeks] == [3, 10]
+
+
+def test_apply_retention_deletes_only_fully_expired_months(tmp_path: Path) -> None:
+    history = _history_with_two_months(tmp_path)
+
+    deleted_count = history.apply_retention(timedelta(days=10), now=datetime(2024, 2, 10))
+
+    assert deleted_count == 0
+    assert history.apply_retention(timedelta(days=10), now=datetime(2024, 2, 11)) == 1
+    assert [weather_result.temperature for weather_result in history.get_range('London')] == [3, 4]
+    assert history.apply_retention(now=datetime(2030, 1, 1)) == 0
+
+
+def test_many_small_flushes_are_compacted(tmp_path: Path) -> None:
+    history = WeatherHistoryManager(str(tmp_path))
+    for minute in range(0, 60, 5):
+        history.append(_weather(minute, '2024-01-01 00:{0:02d}'.format(minute)))
+        history.flush()
+    chunk_path = tmp_path / 'london' / '2024-01.jsonl.gz'
+    assert _count_members(chunk_path) == 12
+
+    assert history.compact() == 1
+
+    assert _count_members(chunk_path) == 1
+    assert len(history.get_range('London')) == 12
+
+
+def test_chunk_is_compacted_when_city_moves_to_next_month(tmp_path: Path) -> None:
+    history = WeatherHistoryManager(str(tmp_path))
+    history.append(_weather(1, '2024-01-30 10:00'))
+    history.flush()
+    history.append(_weather(2, '2024-01-31 10:00'))
+    history.flush()
+
+    history.append(_weather(3, '2024-02-01 10:00'))
+    history.flush()
+
+    assert _count_members(tmp_path / 'london' / '2024-01.jsonl.gz') == 1
+    assert len(history.get_range('London')) == 3
+
+
+@pytest.mark.parametrize('city_name', ['.', '..', '.hidden'])
+def test_dot_city_names_stay_inside_root(tmp_path: Path, city_name: str) -> None:
+    root_dir = tmp_path / 'history'
+    history = WeatherHistoryManager(str(root_dir))
+
+    history.append(WeatherResult(city_name, 1, 'Clear', '2024-01-01 00:00'))
+    history.flush()
+
+    assert history.cities() == [city_name]
+    assert not (tmp_path / '2024-01.jsonl.gz').exists()
+    assert len(history.get_range(city_name)) == 1
@@ -0,0 +1,103 @@
+"""Tests for the multi-key client pool."""
+import pytest
+
+from weather_client import WeatherAPIClient, WeatherAPIClientPool
+from weather_client.exceptions import WeatherAPIEndpointError, WeatherAPIRequestError
+
+
+def _request_with_status(status_code: int, message: str) -> WeatherAPIEndpointError:
+    request_error = WeatherAPIRequestError(message, status_code)
+    try:
+        raise WeatherAPIEndpointError(str(request_error)) from request_error
+    except WeatherAPIEndpointError as error:
+        return error
+
+
+def test_sequential_calls_follow_weights() -> None:
+    pool = WeatherAPIClientPool({'key-a': 2, 'key-b': 1})
+
+    for _ in range(30):
+        pool.call(lambda client: None)
+
+    assert [key_usage['requests'] for key_usage in pool.usage()] == [20, 10]
+
+
+def test_ejected_key_is_skipped_and_request_retried() -> None:
+    pool = WeatherAPIClientPool(['bad-key', 'good-key'])
+
+    def request(client: WeatherAPIClient) -> str:
+        if client is pool._keys[0].client:
+            raise _request_with_status(403, 'API key has exceeded calls per month quota.')
+        return 'ok'
+
+    assert [pool.call(request) for _ in range(4)] == ['ok'] * 4
+    usage = pool.usage()
+    assert usage[0]['ejections'] == 1
+    assert usage[0]['ejected_for'] > 0
+    assert usage[1]['requests'] == 4
+
+
+def test_last_endpoint_error_is_raised_when_no_key_is_left() -> None:
+    pool = WeatherAPIClientPool(['only-key'])
+    endpoint_error = _request_with_status(401, 'API key is invalid.')
+
+    def request(client: WeatherAPIClient) -> None:
+        raise endpoint_error
+
+    with pytest.raises(WeatherAPIEndpointError) as first_error:
+        pool.call(request)
+    with pytest.raises(WeatherAPIEndpointError, match='ejected'):
+        pool.call(request)
+
+    assert first_error.value is endpoint_error
+    assert 'API key is invalid.' in str(first_error.value)
+    assert isinstance(first_error.value.__cause__, WeatherAPIRequestError)
+
+
+def test_non_auth_errors_are_raised_without_ejection() -> None:
+    pool = WeatherAPIClientPool(['key-a', 'key-b'])
+
+    def request(client: WeatherAPIClient) -> None:
+        raise _request_with_status(400, 'No matching location found.')
+
+    with pytest.raises(WeatherAPIEndpointError, match='No matching location'):
+        pool.call(request)
+    assert sum(key_usage['ejections'] for key_usage in pool.usage()) == 0
+
+
+def test_readmitted_key_takes_its_share_of_the_load() -> None:
+    now = [0.0]
+    pool = WeatherAPIClientPool(['key-a', 'key-b'], eject_seconds=60, clock=lambda: now[0])
+    rate_limited = [True]
+    served_by: list[str] = []
+
+    def request(client: WeatherAPIClient) -> None:
+        if client is pool._keys[1].client and rate_limited[0]:
+            raise _request_with_status(429, 'Too many requests.')
+        served_by.append(client._weather_api_key)
+
+    for _ in range(100):
+        pool.call(request)
+    assert served_by.count('key-a') == 100
+    assert pool.usage()[1]['ejections'] == 1
+
+    rate_limited[0] = False
+    now[0] += 61
+    served_by.clear()
+    for _ in range(20):
+        pool.call(request)
+
+    assert served_by.count('key-a') == 10
+    assert served_by.count('key-b') == 10
+
+
+def test_load_decays_with_time() -> None:
+    now = [0.0]
+    pool = WeatherAPIClientPool(['key-a', 'key-b'], clock=lambda: now[0])
+    pool.load_half_life = 10
+
+    for _ in range(8):
+        pool.call(lambda client: None)
+    now[0] += 10
+
+    assert [key_usage['load'] for key_usage in pool.usage()] == [2.0, 2.0]
@@ -0,0 +1,81 @@
+"""Tests for the weather and forecast result managers."""
+from weather_client import WeatherAPIClient, WeatherService
+from weather_client.weather_data_classes import ForecastResult, WeatherResult
+
+
+class FakeWeatherEndpoint(object):
+    """Counts requests and returns a fixed result."""
+
+    def __init__(self, weather_result: WeatherResult) -> None:
+        self.weather_result = weather_result
+        self.requests = 0
+
+    def get_current_weather(self, city_name: str) -> WeatherResult:
+        self.requests += 1
+        return self.weather_result
+
+
+class FakeForecastEndpoint(object):
+    """Returns a fixed forecast and current weather."""
+
+    def __init__(self, forecast: ForecastResult, weather_result: WeatherResult) -> None:
+        self.forecast = forecast
+        self.weather_result = weather_result
+
+    def get_forecast(self, city_name: str) -> ForecastResult:
+        return self.forecast
+
+    def get_forecast_with_current(self, city_name: str) -> tuple[ForecastResult, WeatherResult]:
+        return self.forecast, self.weather_result
+
+
+def _client(weather_result: WeatherResult, forecast_weather_result: WeatherResult) -> WeatherAPIClient:
+    client = WeatherAPIClient('key')
+    client.weather = FakeWeatherEndpoint(weather_result)  # type: ignore[assignment]
+    client.forecast = FakeForecastEndpoint(  # type: ignore[assignment]
+        ForecastResult('London', 15, 10, 20, 'Rain', 80, 0, '2024-01-10'),
+        forecast_weather_result,
+    )
+    return client
+
+
+def test_save_updates_existing_object_fields() -> None:
+    service = WeatherService(WeatherAPIClient('key'))
+    service.weather_data.save(WeatherResult('London', 10, 'Sunny', '2024-01-10 10:00'))
+
+    saved_result = service.weather_data.save(WeatherResult('london', 20, 'Rain', '2024-01-10 10:15'))
+
+    assert service.weather_data.count() == 1
+    assert (saved_result.temperature, saved_result.condition, saved_result.last_updated) == (
+        20, 'Rain', '2024-01-10 10:15',
+    )
+
+
+def test_fresh_weather_comes_from_latest_forecast() -> None:
+    client = _client(
+        WeatherResult('London', 10, 'Sunny', '2024-01-10 10:00'),
+        WeatherResult('London', 20, 'Rain', '2024-01-10 10:15'),
+    )
+    service = WeatherService(client, freshness_window=60)
+    service.weather_data.request_and_save_weather('London')
+
+    service.forecast_data.request_and_save_forecast('London')
+    weather_result = service.weather_data.request_and_save_weather('London')
+
+    assert client.weather.requests == 1
+    assert (weather_result.temperature, weather_result.condition) == (20, 'Rain')
+
+
+def test_forecast_does_not_touch_weather_data_without_freshness_window() -> None:
+    client = _client(
+        WeatherResult('London', 10, 'Sunny', '2024-01-10 10:00'),
+        WeatherResult('London', 20, 'Rain', '2024-01-10 10:15'),
+    )
+    service = WeatherService(client)
+
+    service.forecast_data.request_and_save_forecast('London')
+    service.weather_data.request_and_save_weather('London')
+
+    assert service.weather_data.count() == 1
+    assert client.weather.requests == 1
+    assert service.weather_data.get('London').temperature == 10
@@ -0,0 +1,102 @@
+"""Tests for the adaptive refresh scheduler."""
+import pytest
+
+from weather_client import WeatherAPIClient, WeatherService
+from weather_client.weather_data_classes import WeatherResult
+from weather_client.weather_scheduler import AdaptiveRefreshScheduler
+
+
+class FakeWeatherEndpoint(object):
+    """Returns queued results instead of requesting the API."""
+
+    def __init__(self, weather_results: list[WeatherResult]) -> None:
+        self.weather_results = weather_results
+
+    def get_current_weather(self, city_name: str) -> WeatherResult:
+        return self.weather_results.pop(0)
+
+
+def test_interval_shortens_for_changing_results() -> None:
+    client = WeatherAPIClient('key')
+    client.weather = FakeWeatherEndpoint([  # type: ignore[assignment]
+        WeatherResult('London', 2.0, 'Clear', '2024-01-09 23:00'),
+        WeatherResult('London', 9.0, 'Rain', '2024-01-09 23:15'),
+        WeatherResult('London', 1.0, 'Snow', '2024-01-09 23:30'),
+    ])
+    now = [0.0]
+    scheduler = AdaptiveRefreshScheduler(
+        WeatherService(client), budget_per_hour=1000, min_interval=10, clock=lambda: now[0],
+    )
+    scheduler.add_city('London')
+    initial_interval = scheduler.effective_interval('London')
+
+    polled_temperatures = []
+    for _ in range(3):
+        polled_temperatures.extend(weather_result.temperature for weather_result in scheduler.run_pending())
+        now[0] += scheduler.effective_interval('London')
+
+    assert polled_temperatures == [2.0, 9.0, 1.0]
+    assert scheduler.effective_interval('London') < initial_interval
+
+
+def test_interval_grows_for_unchanged_results() -> None:
+    client = WeatherAPIClient('key')
+    client.weather = FakeWeatherEndpoint([  # type: ignore[assignment]
+        WeatherResult('London', 2.0, 'Clear', '2024-01-09 23:00') for _ in range(3)
+    ])
+    now = [0.0]
+    scheduler = AdaptiveRefreshScheduler(WeatherService(client), budget_per_hour=1000, clock=lambda: now[0])
+    scheduler.add_city('London')
+    initial_interval = scheduler.effective_interval('London')
+
+    for _ in range(3):
+        scheduler.run_pending()
+        now[0] += scheduler.effective_interval('London')
+
+    assert scheduler.effective_interval('London') > initial_interval
+
+
+class FailingWeatherEndpoint(object):
+    """Raises the given error on the first request, then returns a result."""
+
+    def __init__(self, error: Exception) -> None:
+        self.error = error
+        self.requests = 0
+
+    def get_current_weather(self, city_name: str) -> WeatherResult:
+        self.requests += 1
+        if self.requests == 1:
+            raise self.error
+        return WeatherResult(city_name, 2.0, 'Clear', '2024-01-09 23:00')
+
+
+def test_first_polls_are_spread_within_budget() -> None:
+    client = WeatherAPIClient('key')
+    client.weather = FakeWeatherEndpoint([  # type: ignore[assignment]
+        WeatherResult('City{0}'.format(index), 2.0, 'Clear', '2024-01-09 23:00') for index in range(1000)
+    ])
+    now = [0.0]
+    scheduler = AdaptiveRefreshScheduler(WeatherService(client), budget_per_hour=60, clock=lambda: now[0])
+    for index in range(1000):
+        scheduler.add_city('City{0}'.format(index))
+
+    assert len(scheduler.run_pending()) == 1
+    now[0] = 600
+    assert len(scheduler.run_pending()) == 10
+    assert scheduler.seconds_until_next_poll() == 60
+
+
+@pytest.mark.parametrize('error', [ConnectionError('connection refused'), ValueError('Expecting value')])
+def test_transport_errors_keep_city_scheduled(error: Exception) -> None:
+    client = WeatherAPIClient('key')
+    client.weather = FailingWeatherEndpoint(error)  # type: ignore[assignment]
+    now = [0.0]
+    scheduler = AdaptiveRefreshScheduler(WeatherService(client), budget_per_hour=1000, clock=lambda: now[0])
+    scheduler.add_city('London')
+
+    assert scheduler.run_pending() == []
+    assert scheduler.seconds_until_next_poll() == scheduler.effective_interval('London')
+
+    now[0] += scheduler.effective_interval('London')
+    assert [weather_result.city_name for weather_result in scheduler.run_pending()] == ['London']
+    assert scheduler._stats['london'].errors == 1
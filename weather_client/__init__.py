@@ -1,12 +1,49 @@
 """Module providing weather-related functionality."""
-from weather_client.exceptions import (
-    DataParserError,
-    WeatherAPIClientError,
-    WeatherAPIDataManagerError,
-    WeatherAPIEndpointError,
-    WeatherAPIError,
-    WeatherAPIRequestError,
-    WeatherServiceExceptionError,
-)
-from weather_client.weather_api_client import WeatherAPIClient
-from weather_client.weather_service import WeatherService
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from weather_client.exceptions import (
+        DataParserError,
+        WeatherAPIClientError,
+        WeatherAPIDataManagerError,
+        WeatherAPIEndpointError,
+        WeatherAPIError,
+        WeatherAPIRequestError,
+        WeatherServiceExceptionError,
+    )
+    from weather_client.weather_api_client import WeatherAPIClient
+    from weather_client.weather_api_client_pool import WeatherAPIClientPool
+    from weather_client.weather_scheduler import AdaptiveRefreshScheduler
+    from weather_client.weather_service import WeatherService
+
+_LAZY_IMPORTS = {
+    'DataParserError': 'weather_client.exceptions',
+    'WeatherAPIClientError': 'weather_client.exceptions',
+    'WeatherAPIDataManagerError': 'weather_client.exceptions',
+    'WeatherAPIEndpointError': 'weather_client.exceptions',
+    'WeatherAPIError': 'weather_client.exceptions',
+    'WeatherAPIRequestError': 'weather_client.exceptions',
+    'WeatherServiceExceptionError': 'weather_client.exceptions',
+    'WeatherAPIClient': 'weather_client.weather_api_client',
+    'WeatherAPIClientPool': 'weather_client.weather_api_client_pool',
+    'WeatherService': 'weather_client.weather_service',
+    'AdaptiveRefreshScheduler': 'weather_client.weather_scheduler',
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names on first access."""
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError('module {0!r} has no attribute {1!r}'.format(__name__, name))
+    attribute = getattr(import_module(module_path), name)
+    globals()[name] = attribute
+    return attribute
+
+
+def __dir__() -> list[str]:
+    """List module attributes including lazily imported names."""
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,314 @@
+"""Command-line tool for fetching weather for a list of cities."""
+import argparse
+import csv
+import json
+import os
+import re
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Iterator, Optional, TextIO
+from urllib.parse import quote
+
+from weather_client.exceptions import DataParserError, WeatherAPIEndpointError
+from weather_client.weather_api_client import WeatherAPIClient
+from weather_client.weather_data_classes import ForecastResult, WeatherResult
+
+API_KEY_ENV = 'WEATHER_API_KEY'
+API_KEY_PATTERN = re.compile(r'(key=)[^&\s\'"]+')
+DATA_CLASSES = {
+    'current': WeatherResult,
+    'forecast': ForecastResult,
+}
+
+
+class RateLimiter(object):
+    """Spaces calls evenly so that no more than `rate` calls start per second."""
+
+    def __init__(self, rate: float) -> None:
+        """Initialize the RateLimiter."""
+        self.interval = 1 / rate if rate > 0 else 0
+        self._next_call = time.monotonic()
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        """Block until the next call is allowed."""
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            call_at = max(now, self._next_call)
+            self._next_call = call_at + self.interval
+        if call_at > now:
+            time.sleep(call_at - now)
+
+
+class ResultCache(object):
+    """On-disk cache of fetched results, one JSON file per kind and city."""
+
+    def __init__(self, cache_dir: str, max_age: float) -> None:
+        """
+        Initialize the ResultCache.
+
+        Args:
+            cache_dir (str): The cache directory, empty to disable the cache.
+            max_age (float): The number of seconds an entry stays fresh.
+        """
+        self.cache_dir = cache_dir
+        self.max_age = max_age
+
+    def _path(self, kind: str, city_name: str) -> str:
+        """Get the cache file path of an entry."""
+        return os.path.join(self.cache_dir, kind, '{0}.json'.format(quote(city_name.lower(), safe='')))
+
+    def get(self, kind: str, city_name: str) -> Optional[dict]:
+        """
+        Get a fresh cached entry.
+
+        Args:
+            kind (str): The kind of data.
+            city_name (str): The name of the city.
+
+        Returns:
+            dict: The cached fields or None if missing or stale.
+        """
+        if not self.cache_dir:
+            return None
+        path = self._path(kind, city_name)
+        try:
+            if time.time() - os.path.getmtime(path) > self.max_age:
+                return None
+            with open(path, encoding='utf-8') as cache_file:
+                return json.load(cache_file)
+        except (OSError, ValueError):
+            return None
+
+    def set(self, kind: str, city_name: str, fields: dict) -> bool:
+        """
+        Store an entry. A cache that cannot be written only costs extra requests on the next run.
+
+        Args:
+            kind (str): The kind of data.
+            city_name (str): The name of the city.
+            fields (dict): The fields to store.
+
+        Returns:
+            bool: False if the entry could not be written.
+        """
+        if not self.cache_dir:
+            return False
+        path = self._path(kind, city_name)
+        tmp_path = '{0}.{1}.tmp'.format(path, threading.get_ident())
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as cache_file:
+                json.dump(fields, cache_file)
+            os.replace(tmp_path, path)
+        except OSError:
+            return False
+        return True
+
+
+class BatchFetcher(object):
+    """
+    Fetches weather data for many cities concurrently.
+
+    Each worker thread keeps its own WeatherAPIClient, created on its first request.
+    """
+
+    def __init__(self, api_key: str, kind: str, rate_limiter: RateLimiter, cache: ResultCache) -> None:
+        """Initialize the BatchFetcher."""
+        self.api_key = api_key
+        self.kind = kind
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.fields = tuple(DATA_CLASSES[kind].__annotations__)
+        self._local = threading.local()
+
+    def _client(self) -> WeatherAPIClient:
+        """Get the client of the current thread."""
+        client = getattr(self._local, 'client', None)
+        if client is None:
+            client = WeatherAPIClient(self.api_key)
+            self._local.client = client
+        return client
+
+    def fetch(self, city_name: str) -> tuple[dict, Optional[float]]:
+        """
+        Fetch data for a city, serving fresh entries from the cache.
+
+        Args:
+            city_name (str): The name of the city.
+
+        Returns:
+            tuple[dict, float]: The output row and the request latency in seconds, None when not requested.
+        """
+        cached_fields = self.cache.get(self.kind, city_name)
+        if cached_fields is not None:
+            return {**cached_fields, 'source': 'cache', 'error': ''}, None
+
+        self.rate_limiter.wait()
+        started = time.perf_counter()
+        client = self._client()
+        try:
+            if self.kind == 'forecast':
+                data_obj = client.forecast.get_forecast(city_name)
+            else:
+                data_obj = client.weather.get_current_weather(city_name)
+        except (WeatherAPIEndpointError, DataParserError, OSError, ValueError) as error:
+            latency = time.perf_counter() - started
+            return {'city_name': city_name, 'source': 'api', 'error': redact_api_key(str(error), self.api_key)}, latency
+        latency = time.perf_counter() - started
+        fields = {field: getattr(data_obj, field) for field in self.fields}
+        self.cache.set(self.kind, city_name, fields)
+        return {**fields, 'source': 'api', 'error': ''}, latency
+
+
+def redact_api_key(message: str, api_key: str) -> str:
+    """
+    Hide the API key in a message, e.g. in the request URL of a connection error.
+
+    Args:
+        message (str): The message to redact.
+        api_key (str): The API key.
+
+    Returns:
+        str: The message without the API key.
+    """
+    message = API_KEY_PATTERN.sub(r'\1***', message)
+    return message.replace(api_key, '***') if api_key else message
+
+
+def read_cities(source: TextIO) -> Iterator[str]:
+    """
+    Read city names, one per line, skipping blanks and `#` comments.
+
+    Args:
+        source (TextIO): The input stream.
+
+    Returns:
+        Iterator[str]: The city names.
+    """
+    for line in source:
+        city_name = line.strip()
+        if city_name and not city_name.startswith('#'):
+            yield city_name
+
+
+def format_summary(total: int, errors: int, cached: int, elapsed: float, latencies: list[float]) -> str:
+    """
+    Format the run summary.
+
+    Args:
+        total (int): The number of processed cities.
+        errors (int): The number of failed cities.
+        cached (int): The number of cities served from the cache.
+        elapsed (float): The wall time in seconds.
+        latencies (list[float]): The request latencies in seconds.
+
+    Returns:
+        str: The summary.
+    """
+    summary = 'cities: {0}, requested: {1}, cached: {2}, errors: {3}, elapsed: {4:.2f}s, throughput: {5:.1f}/s'.format(
+        total,
+        len(latencies),
+        cached,
+        errors,
+        elapsed,
+        total / elapsed if elapsed else 0,
+    )
+    if latencies:
+        sorted_ms = sorted(latency * 1000 for latency in latencies)
+        summary += '\nlatency ms: p50 {0:.1f}, p95 {1:.1f}, max {2:.1f}'.format(
+            statistics.median(sorted_ms),
+            sorted_ms[min(len(sorted_ms) - 1, int(len(sorted_ms) * 0.95))],
+            sorted_ms[-1],
+        )
+    return summary
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser."""
+    arg_parser = argparse.ArgumentParser(
+        prog='weather-client',
+        description='Fetch current weather or forecasts for a list of cities.',
+    )
+    arg_parser.add_argument(
+        'input',
+        nargs='?',
+        default='-',
+        type=argparse.FileType('r', encoding='utf-8'),
+        help='file with one city per line, "-" for stdin',
+    )
+    arg_parser.add_argument('--kind', choices=sorted(DATA_CLASSES), default='current')
+    arg_parser.add_argument('--api-key', default=os.environ.get(API_KEY_ENV, ''), help='defaults to $' + API_KEY_ENV)
+    arg_parser.add_argument('--workers', type=int, default=8, help='number of concurrent requests')
+    arg_parser.add_argument('--rate', type=float, default=0, help='max requests per second, 0 for no limit')
+    arg_parser.add_argument('--format', dest='output_format', choices=('jsonl', 'csv'), default='jsonl')
+    arg_parser.add_argument('--output', default='-', help='output file, "-" for stdout')
+    arg_parser.add_argument('--cache-dir', default='', help='directory of the on-disk cache, empty to disable')
+    arg_parser.add_argument('--max-age', type=float, default=600, help='seconds a cached entry stays fresh')
+    arg_parser.add_argument('--quiet', action='store_true', help='do not print the summary')
+    return arg_parser
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """
+    Run the command-line tool.
+
+    Args:
+        argv (list[str]): The command-line arguments.
+
+    Returns:
+        int: The exit code.
+    """
+    args = build_arg_parser().parse_args(argv)
+    if not args.api_key:
+        print('API key is required: pass --api-key or set {0}'.format(API_KEY_ENV), file=sys.stderr)
+        return 2
+
+    source = args.input
+    try:
+        output = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8', newline='')
+    except OSError as error:
+        print("weather-client: can't open '{0}': {1}".format(args.output, error.strerror), file=sys.stderr)
+        return 2
+    fetcher = BatchFetcher(args.api_key, args.kind, RateLimiter(args.rate), ResultCache(args.cache_dir, args.max_age))
+    csv_writer = None
+    if args.output_format == 'csv':
+        csv_writer = csv.DictWriter(output, fieldnames=[*fetcher.fields, 'source', 'error'], extrasaction='ignore')
+        csv_writer.writeheader()
+
+    total = errors = cached = 0
+    latencies = []
+    started = time.perf_counter()
+    try:
+        with ThreadPoolExecutor(max_workers=max(args.workers, 1)) as executor:
+            futures = [executor.submit(fetcher.fetch, city_name) for city_name in read_cities(source)]
+            for future in as_completed(futures):
+                row, latency = future.result()
+                total += 1
+                errors += bool(row['error'])
+                cached += row['source'] == 'cache'
+                if latency is not None:
+                    latencies.append(latency)
+                if csv_writer:
+                    csv_writer.writerow(row)
+                else:
+                    output.write(json.dumps(row) + '\n')
+                output.flush()
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if output is not sys.stdout:
+            output.close()
+
+    if not args.quiet:
+        print(format_summary(total, errors, cached, time.perf_counter() - started, latencies), file=sys.stderr)
+    return 1 if errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,5 +1,7 @@
 """Module providing weather-related functionality."""
-from typing import Type
+import json
+import os
+from typing import Iterator, Type
 
 from weather_client.exceptions import DataParserError
 from weather_client.weather_data_classes import BaseDataClass, ForecastResult, WeatherResult
@@ -44,6 +46,24 @@ class BaseDataParser(object):
             raise DataParserError(str(error))
         return self.data_class(**formatted_data)
 
+    @classmethod
+    def parse_document(cls, raw_document: bytes | str) -> tuple:
+        """
+        Parse a raw JSON document into a tuple of field values.
+
+        Args:
+            raw_document (bytes | str): The raw JSON document.
+
+        Returns:
+            tuple: The field values, ordered as the data class annotations.
+        """
+        try:
+            data_to_parse = json.loads(raw_document)
+            parsed_data = cls(data_to_parse)._parse_data(data_to_parse)
+        except (TypeError, ValueError, AttributeError, IndexError) as error:
+            raise DataParserError(str(error))
+        return tuple(parsed_data[field] for field in cls.data_class.__annotations__)
+
 
 class WeatherDataParser(BaseDataParser):
     """
@@ -118,3 +138,134 @@ class ForecastDataParser(BaseDataParser):
             'chance_of_snow': day_data.get('daily_chance_of_snow', 0),
             'date': forecastday.get('date', ''),
         }
+
+
+def _parse_raw_chunk(data_parser: Type[BaseDataParser], raw_chunk: list[bytes], skip_invalid: bool) -> list[tuple]:
+    """
+    Parse a chunk of raw JSON documents into compact row tuples.
+
+    Args:
+        data_parser (Type[BaseDataParser]): The parser class to apply.
+        raw_chunk (list[bytes]): The raw JSON documents.
+        skip_invalid (bool): Whether to drop documents that fail to parse instead of raising.
+
+    Returns:
+        list[tuple]: One tuple of field values per parsed document.
+    """
+    rows = []
+    for raw_document in raw_chunk:
+        try:
+            rows.append(data_parser.parse_document(raw_document))
+        except DataParserError:
+            if not skip_invalid:
+                raise
+    return rows
+
+
+class BulkDataParser(object):
+    """
+    Parser for large batches of raw JSON documents.
+
+    Batches are split into chunks and parsed in a process pool, each worker returning
+    plain tuples instead of data objects to keep pickling cheap. Small batches are parsed in-process.
+
+    Attributes:
+        data_parser (BaseDataParser): The parser applied to every document.
+        chunk_size (int): The number of documents sent to a worker at once.
+        min_pool_batch_size (int): The smallest batch that is worth a process pool.
+        skip_invalid (bool): Whether to drop documents that fail to parse instead of raising DataParserError.
+    """
+
+    chunk_size: int = 500
+    min_pool_batch_size: int = 2000
+
+    def __init__(
+            self,
+            data_parser: Type[BaseDataParser],
+            max_workers: int | None = None,
+            chunk_size: int | None = None,
+            min_pool_batch_size: int | None = None,
+            skip_invalid: bool = False,
+    ) -> None:
+        """Initialize the BulkDataParser."""
+        self.data_parser = data_parser
+        self.skip_invalid = skip_invalid
+        self.max_workers = max_workers or os.cpu_count() or 1
+        if chunk_size:
+            self.chunk_size = chunk_size
+        if min_pool_batch_size is not None:
+            self.min_pool_batch_size = min_pool_batch_size
+
+    @property
+    def fields(self) -> tuple[str, ...]:
+        """Field names in the order they appear in the parsed rows."""
+        return tuple(self.data_parser.data_class.__annotations__)
+
+    def _split_into_chunks(self, raw_documents: list[bytes]) -> Iterator[list[bytes]]:
+        """
+        Split documents into chunks.
+
+        Args:
+            raw_documents (list[bytes]): The raw JSON documents.
+
+        Returns:
+            Iterator[list[bytes]]: The chunks of documents.
+        """
+        for start in range(0, len(raw_documents), self.chunk_size):
+            yield raw_documents[start:start + self.chunk_size]
+
+    def parse_rows(self, raw_documents: list[bytes]) -> list[tuple]:
+        """
+        Parse raw JSON documents into row tuples.
+
+        Args:
+            raw_documents (list[bytes]): The raw JSON documents.
+
+        Returns:
+            list[tuple]: One tuple per parsed document, values ordered as in `fields`.
+        """
+        if len(raw_documents) < self.min_pool_batch_size or self.max_workers < 2:
+            return _parse_raw_chunk(self.data_parser, raw_documents, self.skip_invalid)
+
+        from concurrent.futures import ProcessPoolExecutor  # noqa: WPS433 - only needed for large batches
+
+        rows: list[tuple] = []
+        chunks = list(self._split_into_chunks(raw_documents))
+        with ProcessPoolExecutor(max_workers=min(self.max_workers, len(chunks))) as executor:
+            chunk_results = executor.map(
+                _parse_raw_chunk,
+                [self.data_parser] * len(chunks),
+                chunks,
+                [self.skip_invalid] * len(chunks),
+            )
+            for chunk_rows in chunk_results:
+                rows.extend(chunk_rows)
+        return rows
+
+    def parse_columns(self, raw_documents: list[bytes]) -> dict[str, list]:
+        """
+        Parse raw JSON documents into a columnar batch.
+
+        Args:
+            raw_documents (list[bytes]): The raw JSON documents.
+
+        Returns:
+            dict[str, list]: A list of values per field name.
+        """
+        rows = self.parse_rows(raw_documents)
+        if not rows:
+            return {field: [] for field in self.fields}
+        return {field: list(column) for field, column in zip(self.fields, zip(*rows))}
+
+    def parse_objects(self, raw_documents: list[bytes]) -> list[BaseDataClass]:
+        """
+        Parse raw JSON documents into data objects.
+
+        Args:
+            raw_documents (list[bytes]): The raw JSON documents.
+
+        Returns:
+            list[BaseDataClass]: The data objects.
+        """
+        data_class = self.data_parser.data_class
+        return [data_class(**dict(zip(self.fields, row))) for row in self.parse_rows(raw_documents)]
@@ -1,12 +1,23 @@
 """Module providing weather-related functionality."""
+from typing import TYPE_CHECKING, Optional
+
 from weather_client.weather_api_endpoints import ForecastEndpoint, WeatherEndpoint
 
+if TYPE_CHECKING:
+    import requests
+
 
 class WeatherAPIClient(object):
     """Represents the weather API client."""
 
-    def __init__(self, api_key: str) -> None:
-        """Initialize the WeatherAPIClient."""
+    def __init__(self, api_key: str, session: Optional['requests.Session'] = None) -> None:
+        """
+        Initialize the WeatherAPIClient.
+
+        Args:
+            api_key (str): The API key.
+            session (requests.Session): The session reusing connections across requests.
+        """
         self._weather_api_key = api_key
-        self.weather = WeatherEndpoint(self._weather_api_key)
-        self.forecast = ForecastEndpoint(self._weather_api_key)
+        self.weather = WeatherEndpoint(self._weather_api_key, session=session)
+        self.forecast = ForecastEndpoint(self._weather_api_key, session=session)
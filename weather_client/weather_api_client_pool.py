@@ -0,0 +1,295 @@
+"""Module providing a pool of weather API clients bound to different API keys."""
+import math
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from weather_client.exceptions import WeatherAPIClientError, WeatherAPIEndpointError, WeatherAPIRequestError
+from weather_client.weather_api_client import WeatherAPIClient
+
+EJECTING_STATUS_CODES = frozenset((401, 403, 429))
+
+
+class PooledAPIKey(object):
+    """
+    Represents an API key of the pool with its client and usage counters.
+
+    Attributes:
+        weight (float): The share of the load the key takes relative to the other keys.
+        in_flight (int): The number of running requests.
+        requests (int): The number of finished requests.
+        load (float): The number of finished requests, decayed with the age of each request.
+        errors (int): The number of failed requests.
+        ejections (int): The number of times the key was ejected.
+        ejected_until (float): The monotonic time until which the key is not used, 0 once it is readmitted.
+    """
+
+    def __init__(self, api_key: str, weight: float, client: WeatherAPIClient) -> None:
+        """Initialize the PooledAPIKey."""
+        self.api_key = api_key
+        self.weight = weight
+        self.client = client
+        self.in_flight = 0
+        self.requests = 0
+        self.load = 0.0
+        self.load_updated = 0.0
+        self.errors = 0
+        self.ejections = 0
+        self.ejected_until = 0.0
+
+    def decay_load(self, now: float, half_life: float) -> None:
+        """
+        Decay the load to the given time.
+
+        Args:
+            now (float): The current monotonic time.
+            half_life (float): The number of seconds after which a finished request counts half.
+        """
+        if now > self.load_updated:
+            self.load *= math.pow(0.5, (now - self.load_updated) / half_life)
+        self.load_updated = now
+
+    @property
+    def masked_key(self) -> str:
+        """The API key with all but the last four characters hidden."""
+        return '*' * max(len(self.api_key) - 4, 0) + self.api_key[-4:]
+
+
+class PooledEndpoint(object):
+    """Forwards endpoint calls to the endpoint of the key picked by the pool."""
+
+    def __init__(self, pool: 'WeatherAPIClientPool', endpoint_name: str) -> None:
+        """Initialize the PooledEndpoint."""
+        self._pool = pool
+        self._endpoint_name = endpoint_name
+
+    def _call(self, method_name: str, *args: Any, **kwargs: Any) -> Any:
+        """Call an endpoint method through the pool."""
+        return self._pool.call(
+            lambda client: getattr(getattr(client, self._endpoint_name), method_name)(*args, **kwargs),
+        )
+
+
+class PooledWeatherEndpoint(PooledEndpoint):
+    """Pooled counterpart of WeatherEndpoint."""
+
+    def get_current_weather(self, city_name: str) -> Any:
+        """
+        Get current weather data for a city.
+
+        Args:
+            city_name (str): The name of the city.
+
+        Returns:
+            Any: The current weather data object for the city.
+        """
+        return self._call('get_current_weather', city_name)
+
+
+class PooledForecastEndpoint(PooledEndpoint):
+    """Pooled counterpart of ForecastEndpoint."""
+
+    def get_forecast(self, city_name: str) -> Any:
+        """
+        Get forecast data for a city.
+
+        Args:
+            city_name (str): The name of the city.
+
+        Returns:
+            Any: The forecast data object for the city.
+        """
+        return self._call('get_forecast', city_name)
+
+    def get_forecast_with_current(self, city_name: str) -> tuple[Any, Any]:
+        """
+        Get forecast and current weather data for a city with a single request.
+
+        Args:
+            city_name (str): The name of the city.
+
+        Returns:
+            tuple: The forecast data object and the current weather data object for the city.
+        """
+        return self._call('get_forecast_with_current', city_name)
+
+
+class WeatherAPIClientPool(WeatherAPIClient):
+    """
+    Weather API client spreading requests over several API keys.
+
+    Every key has its own client with a connection-pooling session. Each request goes to the available key
+    with the lowest current load relative to its weight: its requests in flight plus its finished requests,
+    decayed with a half-life of `load_half_life` seconds. A readmitted key starts at the weighted load
+    of the other keys, so it takes its share instead of every request.
+    A key answering with an auth, quota or rate limit error is ejected for `eject_seconds` and the request
+    is retried with another key. When no key is left, the last endpoint error is raised, as a single client would.
+
+    Attributes:
+        load_half_life (float): The number of seconds after which a finished request counts half in the load.
+    """
+
+    load_half_life: float = 60
+
+    def __init__(
+            self,
+            api_keys: list[str] | dict[str, float],
+            eject_seconds: float = 60,
+            clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the WeatherAPIClientPool.
+
+        Args:
+            api_keys (list[str] | dict[str, float]): The API keys, optionally mapped to their weights.
+            eject_seconds (float): The number of seconds a failing key is not used.
+            clock (Callable): The source of the current time in seconds.
+        """
+        import requests  # noqa: WPS433 - the HTTP stack is loaded when a pool is created
+
+        weighted_keys = api_keys if isinstance(api_keys, dict) else dict.fromkeys(api_keys, 1.0)
+        if not weighted_keys:
+            raise WeatherAPIClientError('At least one API key is required')
+        if any(weight <= 0 for weight in weighted_keys.values()):
+            raise WeatherAPIClientError('API key weights must be positive')
+        self.eject_seconds = eject_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._keys = [
+            PooledAPIKey(api_key, weight, WeatherAPIClient(api_key, session=requests.Session()))
+            for api_key, weight in weighted_keys.items()
+        ]
+        self._weather_api_key = self._keys[0].api_key
+        self.weather = PooledWeatherEndpoint(self, 'weather')  # type: ignore[assignment]
+        self.forecast = PooledForecastEndpoint(self, 'forecast')  # type: ignore[assignment]
+
+    def _acquire(self, excluded: set[int]) -> Optional[PooledAPIKey]:
+        """
+        Pick the available key with the lowest weighted load and mark a request on it.
+
+        Args:
+            excluded (set[int]): Indices of keys already tried for this request.
+
+        Returns:
+            PooledAPIKey: The picked key, None if no key is available.
+        """
+        with self._lock:
+            now = self._clock()
+            available = [pooled_key for pooled_key in self._keys if pooled_key.ejected_until <= now]
+            for pooled_key in available:
+                pooled_key.decay_load(now, self.load_half_life)
+            self._align_readmitted(available)
+            candidates = [pooled_key for pooled_key in available if self._keys.index(pooled_key) not in excluded]
+            if not candidates:
+                return None
+            pooled_key = min(
+                candidates,
+                key=lambda candidate: (
+                    (candidate.in_flight + candidate.load + 1) / candidate.weight,
+                    candidate.in_flight,
+                ),
+            )
+            pooled_key.in_flight += 1
+            return pooled_key
+
+    def _align_readmitted(self, available: list[PooledAPIKey]) -> None:
+        """
+        Start readmitted keys at the lowest weighted load of the other available keys.
+
+        Args:
+            available (list[PooledAPIKey]): The keys that are not ejected, with their load decayed.
+        """
+        readmitted = [pooled_key for pooled_key in available if pooled_key.ejected_until]
+        if not readmitted:
+            return
+        serving = [pooled_key for pooled_key in available if not pooled_key.ejected_until]
+        if serving:
+            weighted_load = min(pooled_key.load / pooled_key.weight for pooled_key in serving)
+            for pooled_key in readmitted:
+                pooled_key.load = max(pooled_key.load, weighted_load * pooled_key.weight)
+        for pooled_key in readmitted:
+            pooled_key.ejected_until = 0.0
+
+    def _release(self, pooled_key: PooledAPIKey, error: Optional[Exception] = None) -> bool:
+        """
+        Finish a request on a key, ejecting the key on auth, quota or rate limit errors.
+
+        Args:
+            pooled_key (PooledAPIKey): The key used for the request.
+            error (Exception): The error raised by the request.
+
+        Returns:
+            bool: True if the key was ejected.
+        """
+        with self._lock:
+            pooled_key.decay_load(self._clock(), self.load_half_life)
+            pooled_key.in_flight -= 1
+            pooled_key.requests += 1
+            pooled_key.load += 1
+            if error is None:
+                return False
+            pooled_key.errors += 1
+            cause = error.__cause__
+            status_code = cause.args[1] if isinstance(cause, WeatherAPIRequestError) and len(cause.args) > 1 else None
+            if status_code not in EJECTING_STATUS_CODES:
+                return False
+            pooled_key.ejections += 1
+            pooled_key.ejected_until = self._clock() + self.eject_seconds
+            return True
+
+    def call(self, request: Callable[[WeatherAPIClient], Any]) -> Any:
+        """
+        Run a request with a client of the pool.
+
+        Args:
+            request (Callable): The function making the request with the given client.
+
+        Returns:
+            Any: The result of the request.
+        """
+        tried: set[int] = set()
+        last_error: Optional[WeatherAPIEndpointError] = None
+        while True:
+            pooled_key = self._acquire(tried)
+            if pooled_key is None:
+                if last_error is not None:
+                    raise last_error
+                raise WeatherAPIEndpointError('No API key is available, all keys are ejected')
+            try:
+                response_data = request(pooled_key.client)
+            except WeatherAPIEndpointError as error:
+                if not self._release(pooled_key, error):
+                    raise
+                tried.add(self._keys.index(pooled_key))
+                last_error = error
+                continue
+            except Exception as error:
+                self._release(pooled_key, error)
+                raise
+            self._release(pooled_key)
+            return response_data
+
+    def usage(self) -> list[dict]:
+        """
+        Get the usage of every key.
+
+        Returns:
+            list[dict]: The counters of every key, with the key masked.
+        """
+        with self._lock:
+            now = self._clock()
+            for pooled_key in self._keys:
+                pooled_key.decay_load(now, self.load_half_life)
+            return [
+                {
+                    'api_key': pooled_key.masked_key,
+                    'weight': pooled_key.weight,
+                    'in_flight': pooled_key.in_flight,
+                    'requests': pooled_key.requests,
+                    'load': pooled_key.load,
+                    'errors': pooled_key.errors,
+                    'ejections': pooled_key.ejections,
+                    'ejected_for': max(0.0, pooled_key.ejected_until - now),
+                }
+                for pooled_key in self._keys
+            ]
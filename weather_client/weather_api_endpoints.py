@@ -1,11 +1,14 @@
 """Module providing weather-related functionality."""
-from typing import Any, Optional, Type
+from typing import TYPE_CHECKING, Any, Optional, Type
 
 from weather_client.data_parsers import BaseDataParser, ForecastDataParser, WeatherDataParser
 from weather_client.exceptions import DataParserError, WeatherAPIEndpointError, WeatherAPIRequestError
 from weather_client.settings import BASE_URL, CURRENT_WEATHER_PATH, FORECAST_PATH
 from weather_client.weather_api_requests import BaseWeatherAPIRequest
 
+if TYPE_CHECKING:
+    import requests
+
 
 class BaseWeatherAPIEndpoint(BaseWeatherAPIRequest):
     """
@@ -19,29 +22,41 @@ class BaseWeatherAPIEndpoint(BaseWeatherAPIRequest):
     base_url: str = BASE_URL
     data_parser: type = BaseDataParser
 
-    def __init__(self, api_key: str) -> None:
+    def __init__(self, api_key: str, session: Optional['requests.Session'] = None) -> None:
         """Initialize the BaseWeatherAPIEndpoint."""
         self.query_params = {
             'key': api_key,
         }
+        self.session = session
         super().__init__()
 
-    def _request_data(self, query_params: Optional[dict] = None) -> Any:
+    def _request_json(self, query_params: Optional[dict] = None) -> Any:
         """
-        Get data from the API.
+        Get the raw response payload from the API.
 
         Args:
             query_params (dict): The query parameters.
 
         Returns:
-            Any: The data object from the API.
+            Any: The decoded JSON payload.
         """
         try:
             response = self._make_request(path=self.path, query_params=query_params)
         except (WeatherAPIRequestError, DataParserError) as error:
-            raise WeatherAPIEndpointError(str(error))
+            raise WeatherAPIEndpointError(str(error)) from error
+        return response.json()
 
-        return self.data_parser(response.json()).data_to_object()
+    def _request_data(self, query_params: Optional[dict] = None) -> Any:
+        """
+        Get data from the API.
+
+        Args:
+            query_params (dict): The query parameters.
+
+        Returns:
+            Any: The data object from the API.
+        """
+        return self.data_parser(self._request_json(query_params)).data_to_object()
 
 
 class WeatherEndpoint(BaseWeatherAPIEndpoint):
@@ -106,3 +121,27 @@ class ForecastEndpoint(BaseWeatherAPIEndpoint):
             'q': city_name,
         }
         return self._request_data(query_params)
+
+    def get_forecast_with_current(self, city_name: str) -> tuple[Any, Any]:
+        """
+        Get forecast and current weather data for a city with a single request.
+
+        The forecast payload carries the same `current` block as the current weather endpoint.
+
+        Args:
+            city_name (str): The name of the city.
+
+        Returns:
+            tuple: The forecast data object and the current weather data object for the city.
+        """
+        if not isinstance(city_name, str):
+            raise WeatherAPIEndpointError('Invalid city type. Expected: str, got: {0}'.format(type(city_name)))
+        if not city_name:
+            raise WeatherAPIEndpointError('Argument city_name is required')
+        query_params = {
+            'q': city_name,
+        }
+        response_data = self._request_json(query_params)
+        forecast = self.data_parser(response_data).data_to_object()
+        current_weather = WeatherDataParser(response_data).data_to_object()
+        return forecast, current_weather
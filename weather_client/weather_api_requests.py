@@ -1,10 +1,11 @@
 """Module providing weather-related functionality."""
-from typing import Any, Optional
-
-import requests
+from typing import TYPE_CHECKING, Any, Optional
 
 from weather_client.exceptions import WeatherAPIRequestError
 
+if TYPE_CHECKING:
+    import requests
+
 
 class BaseWeatherAPIRequest(object):
     """
@@ -16,6 +17,7 @@ class BaseWeatherAPIRequest(object):
         headers (dict): The headers for the API.
         request_params (dict): The parameters for the API.
         query_params (dict): The query parameters for the API.
+        session (requests.Session): The session reusing connections, None to use a new connection per request.
     """
 
     user_agent: str = ''.join([
@@ -29,6 +31,7 @@ class BaseWeatherAPIRequest(object):
     path: str = ''
     request_params: dict = {}
     query_params: dict = {}
+    session: Optional['requests.Session'] = None
 
     def __init__(
             self,
@@ -83,11 +86,10 @@ class BaseWeatherAPIRequest(object):
         """
         if not query_params:
             return self.base_url + path
-        self.query_params.update(query_params)
-        encoded_query_params = self._encode_query_params(self.query_params)
+        encoded_query_params = self._encode_query_params({**self.query_params, **query_params})
         return ''.join([self.base_url, path, '?', encoded_query_params])
 
-    def _make_request(self, path: str = '', query_params: Optional[dict] = None) -> requests.Response:
+    def _make_request(self, path: str = '', query_params: Optional[dict] = None) -> 'requests.Response':
         """
         Make the API request.
 
@@ -98,8 +100,11 @@ class BaseWeatherAPIRequest(object):
         Returns:
             requests.Response: The API response.
         """
+        import requests  # noqa: WPS433 - the HTTP stack is loaded on the first request
+
         url = self._build_url(path, query_params)
-        response = requests.get(url, headers=self.headers, params=self.request_params, timeout=5)
+        http_client: Any = self.session or requests
+        response = http_client.get(url, headers=self.headers, params=self.request_params, timeout=5)
         if response.status_code != requests.status_codes.codes.ok:
             message = response.json().get('error', {}).get('message')
             status_code = response.status_code
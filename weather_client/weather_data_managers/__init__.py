@@ -1,8 +1,11 @@
 """Module providing weather-related functionality."""
 from weather_client.weather_data_managers.forecast_data_manager import ForecastResultManager
+from weather_client.weather_data_managers.history_data_manager import ForecastHistoryManager, WeatherHistoryManager
 from weather_client.weather_data_managers.weather_data_manager import WeatherResultManager
 
 __all__ = [
     'WeatherResultManager',
     'ForecastResultManager',
+    'WeatherHistoryManager',
+    'ForecastHistoryManager',
 ]
@@ -1,8 +1,9 @@
 """Module providing weather-related functionality."""
-from typing import Generic, Type, TypeVar
+from typing import Generic, Optional, Type, TypeVar
 
 from weather_client.exceptions import WeatherAPIDataManagerError
 from weather_client.weather_data_classes import BaseDataClass
+from weather_client.weather_data_managers.history_data_manager import BaseHistoryManager
 
 T = TypeVar('T', bound=BaseDataClass)
 
@@ -13,9 +14,10 @@ class BaseDataManager(Generic[T]):
     data_class: Type[T]
     objects_storage: list = []
 
-    def __init__(self, filter_field: str) -> None:
+    def __init__(self, filter_field: str, history: Optional[BaseHistoryManager] = None) -> None:
         """Initialize the BaseDataManager."""
         self.filter_field = filter_field
+        self.history = history
 
     def _save_or_update_object(self, data_obj: T) -> T:
         """
@@ -37,7 +39,7 @@ class BaseDataManager(Generic[T]):
 
         for existing_obj in self.objects_storage:
             if getattr(existing_obj, filter_field).lower() == filter_value.lower():
-                for field in self.data_class.__dict__:
+                for field in self.data_class.__annotations__:
                     setattr(existing_obj, field, getattr(data_obj, field))
                 return existing_obj
         self.objects_storage.append(data_obj)
@@ -103,6 +105,8 @@ class BaseDataManager(Generic[T]):
         """
         if not data_obj:
             return None
+        if self.history:
+            self.history.append(data_obj)
         try:
             saved_obj = self._save_or_update_object(data_obj)
         except TypeError as error:
@@ -3,6 +3,8 @@ from weather_client.exceptions import WeatherAPIClientError, WeatherAPIDataManag
 from weather_client.weather_api_client import WeatherAPIClient
 from weather_client.weather_data_classes import ForecastResult
 from weather_client.weather_data_managers.base_data_manager import BaseDataManager
+from weather_client.weather_data_managers.history_data_manager import ForecastHistoryManager
+from weather_client.weather_data_managers.weather_data_manager import WeatherResultManager
 
 
 class ForecastResultManager(BaseDataManager):
@@ -10,11 +12,24 @@ class ForecastResultManager(BaseDataManager):
 
     data_class = ForecastResult
 
-    def __init__(self, api_client: WeatherAPIClient) -> None:
-        """Initialize the WeatherResultManager."""
-        super().__init__(filter_field='city_name')
+    def __init__(
+            self,
+            api_client: WeatherAPIClient,
+            history: ForecastHistoryManager | None = None,
+            weather_manager: WeatherResultManager | None = None,
+    ) -> None:
+        """
+        Initialize the ForecastResultManager.
+
+        Args:
+            api_client (WeatherAPIClient): The client used to request forecasts.
+            history (ForecastHistoryManager): The history store of saved results.
+            weather_manager (WeatherResultManager): The manager storing the current weather of forecast responses.
+        """
+        super().__init__(filter_field='city_name', history=history)
         self.objects_storage = []
         self._api_client = api_client
+        self.weather_manager = weather_manager
 
     def get(self, city_name: str = '') -> ForecastResult | list[ForecastResult]:
         """
@@ -35,6 +50,8 @@ class ForecastResultManager(BaseDataManager):
         """
         Get and save the forecast for the specified city.
 
+        With a weather manager set, the current weather of the same response is saved there as well.
+
         Args:
             city_name (str): The name of the city.
 
@@ -43,7 +60,11 @@ class ForecastResultManager(BaseDataManager):
         """
         client: WeatherAPIClient = self._api_client
         try:
-            forecast = client.forecast.get_forecast(city_name=city_name)
+            if self.weather_manager is None:
+                forecast = client.forecast.get_forecast(city_name=city_name)
+            else:
+                forecast, current_weather = client.forecast.get_forecast_with_current(city_name=city_name)
+                self.weather_manager.save_fetched(current_weather, city_name)
         except WeatherAPIClientError as error:
             raise WeatherAPIDataManagerError(str(error))
         return self.save(forecast)
@@ -0,0 +1,423 @@
+"""Module providing weather-related functionality."""
+import gzip
+import json
+import os
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Generic, Iterator, Type, TypeVar
+from urllib.parse import quote, unquote
+
+from weather_client.exceptions import WeatherAPIDataManagerError
+from weather_client.weather_data_classes import BaseDataClass, ForecastResult, WeatherResult
+
+T = TypeVar('T', bound=BaseDataClass)
+
+CHUNK_SUFFIX = '.jsonl.gz'
+CHUNK_NAME_FORMAT = '%Y-%m'
+
+
+class BaseHistoryManager(Generic[T]):
+    """
+    Append-only on-disk time-series store of data objects keyed by (city, timestamp).
+
+    Rows are kept per city in monthly gzip chunks (`<root>/<city>/<YYYY-MM>.jsonl.gz`).
+    Appends are buffered and written as one compressed member per chunk when `flush_threshold` rows
+    or `flush_interval` seconds accumulate, on reads and on `close()`, so range scans only open the chunks
+    that overlap the requested period. Objects without a timestamp are not stored.
+
+    Small flushes leave many tiny gzip members in a chunk, which compress poorly. A chunk is rewritten
+    as a single member once a city moves on to the next month, after `compact_after_flushes` flushes,
+    and on `close()`.
+
+    Attributes:
+        data_class (type): The class of the stored objects.
+        timestamp_field (str): The object field holding the timestamp.
+        timestamp_format (str): The format of the timestamp field.
+        skip_duplicates (bool): Whether to skip a row repeating the last timestamp of a city.
+        flush_threshold (int): The number of buffered rows that triggers a flush.
+        flush_interval (float): The number of seconds after which buffered rows are flushed on the next append.
+        compact_after_flushes (int): The number of gzip members written to a chunk that triggers its compaction.
+    """
+
+    data_class: Type[T]
+    timestamp_field: str
+    timestamp_format: str
+    skip_duplicates: bool = False
+    flush_threshold: int = 1000
+    flush_interval: float = 5
+    compact_after_flushes: int = 64
+
+    def __init__(self, root_dir: str, retention: timedelta | None = None, compress_level: int = 6) -> None:
+        """
+        Initialize the BaseHistoryManager.
+
+        Args:
+            root_dir (str): The directory holding the chunks.
+            retention (timedelta): The default max age of kept data, None to keep everything.
+            compress_level (int): The gzip compression level.
+        """
+        self.root_dir = root_dir
+        self.retention = retention
+        self.compress_level = compress_level
+        self.fields = tuple(self.data_class.__annotations__)
+        self._buffer: dict[tuple[str, str], list[tuple]] = defaultdict(list)
+        self._buffered_count = 0
+        self._last_timestamps: dict[str, str] = {}
+        self._last_flush = time.monotonic()
+        self._member_counts: dict[str, int] = {}
+        self._city_chunks: dict[str, str] = {}
+        self._chunks_to_compact: set[str] = set()
+        os.makedirs(self.root_dir, exist_ok=True)
+
+    def _city_key(self, city_name: str) -> str:
+        """
+        Get the directory name for a city.
+
+        Args:
+            city_name (str): The name of the city.
+
+        Returns:
+            str: The directory name.
+        """
+        if not isinstance(city_name, str) or not city_name:
+            raise WeatherAPIDataManagerError('Invalid city name: {0}'.format(city_name))
+        return quote(city_name.lower(), safe='').replace('.', '%2E')
+
+    def _parse_timestamp(self, timestamp: str) -> datetime:
+        """
+        Parse the timestamp of a stored object.
+
+        Args:
+            timestamp (str): The timestamp to parse.
+
+        Returns:
+            datetime: The parsed timestamp.
+        """
+        try:
+            return datetime.strptime(timestamp, self.timestamp_format)
+        except (TypeError, ValueError) as error:
+            raise WeatherAPIDataManagerError(str(error))
+
+    def _chunk_paths(
+            self,
+            city_key: str,
+            start: datetime | None,
+            end: datetime | None,
+    ) -> Iterator[tuple[datetime, str]]:
+        """
+        Get the chunk files of a city overlapping the period. Files not named as chunks are skipped.
+
+        Args:
+            city_key (str): The directory name of the city.
+            start (datetime): The start of the period.
+            end (datetime): The end of the period.
+
+        Returns:
+            Iterator[tuple[datetime, str]]: The chunk start and file path, in chronological order.
+        """
+        city_dir = os.path.join(self.root_dir, city_key)
+        if not os.path.isdir(city_dir):
+            return
+        for file_name in sorted(os.listdir(city_dir)):
+            if not file_name.endswith(CHUNK_SUFFIX):
+                continue
+            try:
+                chunk_start = datetime.strptime(file_name[:-len(CHUNK_SUFFIX)], CHUNK_NAME_FORMAT)
+            except ValueError:
+                continue
+            if end and chunk_start > end:
+                continue
+            if start and _next_month(chunk_start) <= start:
+                continue
+            yield chunk_start, os.path.join(city_dir, file_name)
+
+    def _read_chunk(self, path: str) -> Iterator[tuple]:
+        """
+        Read the rows of a chunk file.
+
+        Args:
+            path (str): The chunk file path.
+
+        Returns:
+            Iterator[tuple]: The stored rows.
+        """
+        with gzip.open(path, 'rt', encoding='utf-8') as chunk_file:
+            for line in chunk_file:
+                yield tuple(json.loads(line))
+
+    def _row_to_object(self, row: tuple) -> T:
+        """
+        Convert a stored row to a data object.
+
+        Args:
+            row (tuple): The stored row.
+
+        Returns:
+            T: The data object.
+        """
+        return self.data_class(**dict(zip(self.fields, row)))
+
+    def _chunk_path(self, city_key: str, chunk_name: str) -> str:
+        """
+        Get the file path of a chunk.
+
+        Args:
+            city_key (str): The directory name of the city.
+            chunk_name (str): The month of the chunk.
+
+        Returns:
+            str: The chunk file path.
+        """
+        return os.path.join(self.root_dir, city_key, chunk_name + CHUNK_SUFFIX)
+
+    def _write_member(self, chunk_path: str, rows: list[tuple], mode: str) -> None:
+        """
+        Write rows to a chunk as one gzip member.
+
+        Args:
+            chunk_path (str): The chunk file path.
+            rows (list[tuple]): The rows to write.
+            mode (str): The file mode, 'ab' to append a member or 'wb' to replace the file.
+        """
+        payload = ''.join('{0}\n'.format(json.dumps(row, separators=(',', ':'))) for row in rows)
+        with gzip.open(chunk_path, mode, compresslevel=self.compress_level) as chunk_file:
+            chunk_file.write(payload.encode('utf-8'))
+
+    def _compact_chunk(self, chunk_path: str) -> None:
+        """
+        Rewrite a chunk as a single gzip member.
+
+        Args:
+            chunk_path (str): The chunk file path.
+        """
+        if self._member_counts.get(chunk_path, 2) < 2 or not os.path.exists(chunk_path):
+            return
+        tmp_path = chunk_path + '.tmp'
+        self._write_member(tmp_path, list(self._read_chunk(chunk_path)), 'wb')
+        os.replace(tmp_path, chunk_path)
+        self._member_counts[chunk_path] = 1
+
+    def append(self, data_obj: T) -> bool:
+        """
+        Append an object to the store.
+
+        Args:
+            data_obj (T): The object to append.
+
+        Returns:
+            bool: False if the object was skipped as a duplicate or for having no timestamp.
+        """
+        if not isinstance(data_obj, self.data_class):
+            raise WeatherAPIDataManagerError(
+                'Invalid result type. Expected:{0}, got:{1}'.format(self.data_class, type(data_obj)),
+            )
+        city_key = self._city_key(data_obj.city_name)
+        timestamp = getattr(data_obj, self.timestamp_field)
+        if not timestamp:
+            return False
+        if self.skip_duplicates and self._last_timestamps.get(city_key) == timestamp:
+            return False
+        chunk_name = self._parse_timestamp(timestamp).strftime(CHUNK_NAME_FORMAT)
+        previous_chunk_name = self._city_chunks.get(city_key)
+        if previous_chunk_name and previous_chunk_name < chunk_name:
+            self._chunks_to_compact.add(self._chunk_path(city_key, previous_chunk_name))
+        if not previous_chunk_name or previous_chunk_name < chunk_name:
+            self._city_chunks[city_key] = chunk_name
+        self._buffer[(city_key, chunk_name)].append(tuple(getattr(data_obj, field) for field in self.fields))
+        self._last_timestamps[city_key] = timestamp
+        self._buffered_count += 1
+        if self._buffered_count >= self.flush_threshold:
+            self.flush()
+        elif time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+        return True
+
+    def flush(self) -> int:
+        """
+        Write buffered rows to disk.
+
+        Returns:
+            int: The number of written rows.
+        """
+        written_count = self._buffered_count
+        for (city_key, chunk_name), rows in self._buffer.items():
+            os.makedirs(os.path.join(self.root_dir, city_key), exist_ok=True)
+            chunk_path = self._chunk_path(city_key, chunk_name)
+            if chunk_path not in self._member_counts:
+                self._member_counts[chunk_path] = int(os.path.exists(chunk_path))
+            self._write_member(chunk_path, rows, 'ab')
+            self._member_counts[chunk_path] += 1
+            if self._member_counts[chunk_path] >= self.compact_after_flushes:
+                self._chunks_to_compact.add(chunk_path)
+        self._buffer.clear()
+        self._buffered_count = 0
+        self._last_flush = time.monotonic()
+        for chunk_path in self._chunks_to_compact:
+            self._compact_chunk(chunk_path)
+        self._chunks_to_compact.clear()
+        return written_count
+
+    def compact(self) -> int:
+        """
+        Rewrite every chunk written to in several members as a single member.
+
+        Returns:
+            int: The number of compacted chunks.
+        """
+        self.flush()
+        chunk_paths = [chunk_path for chunk_path, members in self._member_counts.items() if members > 1]
+        for chunk_path in chunk_paths:
+            self._compact_chunk(chunk_path)
+        return len(chunk_paths)
+
+    def close(self) -> None:
+        """Write buffered rows to disk, compact the written chunks and apply the retention period."""
+        self.compact()
+        self.apply_retention()
+
+    def get_range(self, city_name: str, start: datetime | None = None, end: datetime | None = None) -> list[T]:
+        """
+        Get stored objects of a city within a period.
+
+        Args:
+            city_name (str): The name of the city.
+            start (datetime): The inclusive start of the period, None for no lower bound.
+            end (datetime): The inclusive end of the period, None for no upper bound.
+
+        Returns:
+            list[T]: The objects ordered by timestamp.
+        """
+        self.flush()
+        timestamp_index = self.fields.index(self.timestamp_field)
+        selected_rows = []
+        for _, chunk_path in self._chunk_paths(self._city_key(city_name), start, end):
+            for row in self._read_chunk(chunk_path):
+                row_time = self._parse_timestamp(row[timestamp_index])
+                if (start and row_time < start) or (end and row_time > end):
+                    continue
+                selected_rows.append((row_time, row))
+        selected_rows.sort(key=lambda timed_row: timed_row[0])
+        return [self._row_to_object(row) for _, row in selected_rows]
+
+    def downsample(
+            self,
+            city_name: str,
+            interval: timedelta,
+            start: datetime | None = None,
+            end: datetime | None = None,
+    ) -> list[T]:
+        """
+        Get stored objects of a city aggregated into fixed intervals.
+
+        Numeric fields are averaged, other fields take the last value of the interval,
+        and the timestamp is set to the start of the interval.
+
+        Args:
+            city_name (str): The name of the city.
+            interval (timedelta): The length of an interval.
+            start (datetime): The inclusive start of the period.
+            end (datetime): The inclusive end of the period.
+
+        Returns:
+            list[T]: One object per non-empty interval.
+        """
+        if interval <= timedelta(0):
+            raise WeatherAPIDataManagerError('Interval must be positive')
+        buckets: dict[datetime, list[T]] = defaultdict(list)
+        for data_obj in self.get_range(city_name, start, end):
+            obj_time = self._parse_timestamp(getattr(data_obj, self.timestamp_field))
+            buckets[datetime.min + (obj_time - datetime.min) // interval * interval].append(data_obj)
+
+        downsampled = []
+        for bucket_start, bucket_objects in buckets.items():
+            aggregated = {}
+            for field in self.fields:
+                values = [getattr(data_obj, field) for data_obj in bucket_objects]
+                if all(isinstance(field_value, (int, float)) for field_value in values):
+                    aggregated[field] = sum(values) / len(values)
+                else:
+                    aggregated[field] = values[-1]
+            aggregated[self.timestamp_field] = bucket_start.strftime(self.timestamp_format)
+            downsampled.append(self.data_class(**aggregated))
+        return downsampled
+
+    def apply_retention(self, max_age: timedelta | None = None, now: datetime | None = None) -> int:
+        """
+        Delete chunks holding only data older than the retention period.
+
+        Args:
+            max_age (timedelta): The max age of kept data, defaults to the store retention.
+            now (datetime): The reference time, defaults to the current time.
+
+        Returns:
+            int: The number of deleted chunk files.
+        """
+        max_age = max_age or self.retention
+        if not max_age:
+            return 0
+        self.flush()
+        cutoff = (now or datetime.now()) - max_age
+        deleted_count = 0
+        for city_key in os.listdir(self.root_dir):
+            for chunk_start, chunk_path in list(self._chunk_paths(city_key, None, None)):
+                if _next_month(chunk_start) <= cutoff:
+                    os.remove(chunk_path)
+                    self._member_counts.pop(chunk_path, None)
+                    deleted_count += 1
+        return deleted_count
+
+    def cities(self) -> list[str]:
+        """
+        Get the stored cities.
+
+        Returns:
+            list[str]: The lowercased names of the stored cities.
+        """
+        self.flush()
+        return sorted(
+            unquote(city_key) for city_key in os.listdir(self.root_dir)
+            if os.path.isdir(os.path.join(self.root_dir, city_key))
+        )
+
+
+class WeatherHistoryManager(BaseHistoryManager):
+    """
+    Stores the history of weather results.
+
+    Attributes:
+        data_class (type): The class used to store weather results.
+    """
+
+    data_class = WeatherResult
+    timestamp_field = 'last_updated'
+    timestamp_format = '%Y-%m-%d %H:%M'
+    skip_duplicates = True
+
+
+class ForecastHistoryManager(BaseHistoryManager):
+    """
+    Stores the history of forecast results.
+
+    Attributes:
+        data_class (type): The class used to store forecast results.
+    """
+
+    data_class = ForecastResult
+    timestamp_field = 'date'
+    timestamp_format = '%Y-%m-%d'
+
+
+def _next_month(month_start: datetime) -> datetime:
+    """
+    Get the start of the following month.
+
+    Args:
+        month_start (datetime): The start of a month.
+
+    Returns:
+        datetime: The start of the following month.
+    """
+    if month_start.month == 12:
+        return month_start.replace(year=month_start.year + 1, month=1)
+    return month_start.replace(month=month_start.month + 1)
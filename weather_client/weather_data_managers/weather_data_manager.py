@@ -1,8 +1,11 @@
 """Module providing weather-related functionality."""
+import time
+
 from weather_client.exceptions import WeatherAPIClientError, WeatherAPIDataManagerError
 from weather_client.weather_api_client import WeatherAPIClient
 from weather_client.weather_data_classes import WeatherResult
 from weather_client.weather_data_managers.base_data_manager import BaseDataManager
+from weather_client.weather_data_managers.history_data_manager import WeatherHistoryManager
 
 
 class WeatherResultManager(BaseDataManager):
@@ -15,11 +18,61 @@ class WeatherResultManager(BaseDataManager):
 
     data_class = WeatherResult
 
-    def __init__(self, api_client: WeatherAPIClient) -> None:
-        """Initialize the WeatherResultManager."""
-        super().__init__(filter_field='city_name')
+    def __init__(
+            self,
+            api_client: WeatherAPIClient,
+            history: WeatherHistoryManager | None = None,
+            freshness_window: float = 0,
+    ) -> None:
+        """
+        Initialize the WeatherResultManager.
+
+        Args:
+            api_client (WeatherAPIClient): The client used to request weather.
+            history (WeatherHistoryManager): The history store of saved results.
+            freshness_window (float): The number of seconds a fetched result is served without a new request.
+        """
+        super().__init__(filter_field='city_name', history=history)
         self.objects_storage = []
         self._api_client = api_client
+        self.freshness_window = freshness_window
+        self._fetched_at: dict[str, float] = {}
+
+    def _get_fresh(self, city_name: str) -> WeatherResult | None:
+        """
+        Get a stored result fetched within the freshness window.
+
+        Args:
+            city_name (str): The name of the city.
+
+        Returns:
+            WeatherResult: The fresh result or None.
+        """
+        if self.freshness_window <= 0 or not isinstance(city_name, str):
+            return None
+        fetched_at = self._fetched_at.get(city_name.lower())
+        if fetched_at is None or time.monotonic() - fetched_at > self.freshness_window:
+            return None
+        return self._get_object(city_name)
+
+    def save_fetched(self, weather_result: WeatherResult, city_name: str = '') -> WeatherResult | None:
+        """
+        Save a result fetched from the API and mark it as fresh.
+
+        Args:
+            weather_result (WeatherResult): The fetched result.
+            city_name (str): The requested city name, if it differs from the one in the result.
+
+        Returns:
+            WeatherResult: The saved result.
+        """
+        saved_obj = self.save(weather_result)
+        if saved_obj:
+            fetched_at = time.monotonic()
+            self._fetched_at[saved_obj.city_name.lower()] = fetched_at
+            if city_name:
+                self._fetched_at[city_name.lower()] = fetched_at
+        return saved_obj
 
     def get(self, city_name: str = '') -> WeatherResult | list[WeatherResult]:
         """
@@ -40,18 +93,23 @@ class WeatherResultManager(BaseDataManager):
         """
         Get and save the current weather for the specified city.
 
+        A result fetched within the freshness window, e.g. from a forecast request, is returned without a request.
+
         Args:
             city_name (str): The name of the city.
 
         Returns:
             WeatherResult: The current weather for the specified city.
         """
+        fresh_weather = self._get_fresh(city_name)
+        if fresh_weather:
+            return fresh_weather
         client: WeatherAPIClient = self._api_client
         try:
             current_weather = client.weather.get_current_weather(city_name=city_name)
         except WeatherAPIClientError as error:
             raise WeatherAPIDataManagerError(str(error))
-        return self.save(current_weather)
+        return self.save_fetched(current_weather, city_name)
 
     def clear(self, city_name: str = '') -> int:
         """
@@ -63,4 +121,8 @@ class WeatherResultManager(BaseDataManager):
         Returns:
             int: The number of deleted objects.
         """
+        if city_name:
+            self._fetched_at.pop(city_name.lower(), None)
+        else:
+            self._fetched_at.clear()
         return self._delete_stored_objects(city_name)
@@ -0,0 +1,289 @@
+"""Module providing adaptive refresh scheduling for the Weather Service."""
+import heapq
+import time
+from datetime import datetime
+from typing import Callable, Optional
+
+from weather_client.exceptions import (
+    DataParserError,
+    WeatherAPIClientError,
+    WeatherAPIDataManagerError,
+    WeatherAPIEndpointError,
+    WeatherServiceExceptionError,
+)
+from weather_client.weather_data_classes import WeatherResult
+from weather_client.weather_service import WeatherService
+
+LAST_UPDATED_FORMAT = '%Y-%m-%d %H:%M'
+
+
+class CityRefreshStats(object):
+    """
+    Learned refresh statistics of a city.
+
+    Attributes:
+        update_interval (float): The smoothed number of seconds between upstream updates.
+        volatility (float): The smoothed temperature change per hour, plus a penalty per condition change.
+        interval (float): The desired polling interval in seconds, before the budget is applied.
+        due (float): The time of the next scheduled poll.
+        last_updated (str): The `last_updated` value of the latest polled result.
+        temperature (int | float): The temperature of the latest polled result.
+        condition (str): The condition of the latest polled result.
+    """
+
+    def __init__(self, city_name: str, update_interval: float) -> None:
+        """Initialize the CityRefreshStats."""
+        self.city_name = city_name
+        self.update_interval = update_interval
+        self.volatility = 0.0
+        self.interval = update_interval
+        self.due = 0.0
+        self.last_updated: Optional[str] = None
+        self.temperature: int | float = 0
+        self.condition = ''
+        self.polls = 0
+        self.errors = 0
+
+
+class AdaptiveRefreshScheduler(object):
+    """
+    Polls cities through a WeatherService at intervals learned from their results.
+
+    Each city's interval follows its upstream update cadence and is shortened for volatile weather.
+    When the desired intervals of all cities exceed the request budget, every interval is stretched
+    by the same factor. The first polls of added cities are spaced evenly within the budget instead of
+    being made at once. Due polls are kept in a heap, so scheduling a city is O(log n).
+
+    Attributes:
+        default_update_interval (float): The assumed upstream update cadence of a new city, in seconds.
+        condition_change_weight (float): The volatility added by a change of the weather condition.
+        smoothing (float): The weight of the newest observation in the moving averages.
+    """
+
+    default_update_interval: float = 900
+    condition_change_weight: float = 1.0
+    smoothing: float = 0.3
+
+    def __init__(
+            self,
+            service: WeatherService,
+            budget_per_hour: float,
+            min_interval: float = 300,
+            max_interval: float = 6 * 3600,
+            clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Initialize the AdaptiveRefreshScheduler.
+
+        Args:
+            service (WeatherService): The service used to request and save weather.
+            budget_per_hour (float): The max number of requests per hour across all cities.
+            min_interval (float): The shortest polling interval in seconds.
+            max_interval (float): The longest polling interval in seconds.
+            clock (Callable): The source of the current time in seconds.
+        """
+        if budget_per_hour <= 0:
+            raise WeatherServiceExceptionError('Request budget must be positive')
+        if not 0 < min_interval <= max_interval:
+            raise WeatherServiceExceptionError('Invalid polling interval bounds')
+        self.service = service
+        self.budget_per_hour = budget_per_hour
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self._clock = clock
+        self._stats: dict[str, CityRefreshStats] = {}
+        self._queue: list[tuple[float, str]] = []
+        self._desired_rate = 0.0
+        self._next_first_poll = 0.0
+
+    def _clamp(self, interval: float) -> float:
+        """Clamp an interval to the configured bounds."""
+        return min(max(interval, self.min_interval), self.max_interval)
+
+    def _set_interval(self, stats: CityRefreshStats, interval: float) -> None:
+        """
+        Change the desired interval of a city, keeping the total desired rate up to date.
+
+        Args:
+            stats (CityRefreshStats): The statistics of the city.
+            interval (float): The new desired interval.
+        """
+        self._desired_rate += 1 / interval - 1 / stats.interval
+        stats.interval = interval
+
+    def _schedule(self, stats: CityRefreshStats, due: float) -> None:
+        """
+        Schedule the next poll of a city.
+
+        Args:
+            stats (CityRefreshStats): The statistics of the city.
+            due (float): The time of the next poll.
+        """
+        stats.due = due
+        heapq.heappush(self._queue, (due, stats.city_name.lower()))
+
+    @property
+    def budget_factor(self) -> float:
+        """The factor applied to every interval to keep the total rate within the budget."""
+        return max(1.0, self._desired_rate * 3600 / self.budget_per_hour)
+
+    def effective_interval(self, city_name: str) -> float:
+        """
+        Get the polling interval of a city after the budget is applied.
+
+        Args:
+            city_name (str): The name of the city.
+
+        Returns:
+            float: The interval in seconds.
+        """
+        stats = self._stats.get(city_name.lower())
+        if stats is None:
+            raise WeatherServiceExceptionError('City is not scheduled: {0}'.format(city_name))
+        return stats.interval * self.budget_factor
+
+    def add_city(self, city_name: str) -> None:
+        """
+        Add a city, polling it as soon as the budget allows.
+
+        Args:
+            city_name (str): The name of the city.
+        """
+        if not isinstance(city_name, str) or not city_name:
+            raise WeatherServiceExceptionError('Invalid city name: {0}'.format(city_name))
+        city_key = city_name.lower()
+        if city_key in self._stats:
+            return
+        stats = CityRefreshStats(city_name, self._clamp(self.default_update_interval))
+        stats.interval = stats.update_interval
+        self._stats[city_key] = stats
+        self._desired_rate += 1 / stats.interval
+        first_poll = max(self._clock(), self._next_first_poll)
+        self._next_first_poll = first_poll + 3600 / self.budget_per_hour
+        self._schedule(stats, first_poll)
+
+    def remove_city(self, city_name: str) -> bool:
+        """
+        Remove a city. Its queued poll is dropped lazily.
+
+        Args:
+            city_name (str): The name of the city.
+
+        Returns:
+            bool: False if the city was not scheduled.
+        """
+        stats = self._stats.pop(city_name.lower(), None)
+        if stats is None:
+            return False
+        self._desired_rate -= 1 / stats.interval
+        return True
+
+    def observe(self, city_name: str, weather_result: WeatherResult) -> None:
+        """
+        Update the statistics of a city with a new result.
+
+        Args:
+            city_name (str): The name of the scheduled city.
+            weather_result (WeatherResult): The polled result.
+        """
+        stats = self._stats.get(city_name.lower())
+        if stats is None:
+            return
+        previous_updated, previous_temperature, previous_condition = (
+            stats.last_updated, stats.temperature, stats.condition,
+        )
+        stats.last_updated = weather_result.last_updated
+        stats.temperature = weather_result.temperature
+        stats.condition = weather_result.condition
+        if previous_updated is None:
+            return
+        smoothing = self.smoothing
+        if previous_updated == weather_result.last_updated:
+            stats.update_interval = self._clamp(stats.update_interval * (1 + smoothing))
+        else:
+            try:
+                gap = (
+                    datetime.strptime(weather_result.last_updated, LAST_UPDATED_FORMAT)
+                    - datetime.strptime(previous_updated, LAST_UPDATED_FORMAT)
+                ).total_seconds()
+            except (TypeError, ValueError):
+                gap = stats.update_interval
+            if gap > 0:
+                temperature_rate = abs(weather_result.temperature - previous_temperature) * 3600 / gap
+                condition_change = self.condition_change_weight * (weather_result.condition != previous_condition)
+                stats.update_interval = self._clamp((1 - smoothing) * stats.update_interval + smoothing * gap)
+                stats.volatility = (1 - smoothing) * stats.volatility + smoothing * (
+                    temperature_rate + condition_change
+                )
+        self._set_interval(stats, self._clamp(stats.update_interval / (1 + stats.volatility)))
+
+    def seconds_until_next_poll(self) -> Optional[float]:
+        """
+        Get the time left until the next due poll.
+
+        Returns:
+            float: The number of seconds, None when no city is scheduled.
+        """
+        while self._queue:
+            due, city_key = self._queue[0]
+            stats = self._stats.get(city_key)
+            if stats is not None and stats.due == due:
+                return max(0.0, due - self._clock())
+            heapq.heappop(self._queue)
+        return None
+
+    def run_pending(self, max_polls: Optional[int] = None) -> list[WeatherResult]:
+        """
+        Poll every city that is due.
+
+        Args:
+            max_polls (int): The max number of polls in this call, None for no limit.
+
+        Returns:
+            list[WeatherResult]: The fetched results, as saved to the service.
+        """
+        now = self._clock()
+        results = []
+        polls = 0
+        while self._queue and (max_polls is None or polls < max_polls):
+            due, city_key = self._queue[0]
+            if due > now:
+                break
+            heapq.heappop(self._queue)
+            stats = self._stats.get(city_key)
+            if stats is None or stats.due != due:
+                continue
+            stats.polls += 1
+            polls += 1
+            try:
+                weather_result = self.service.api_client.weather.get_current_weather(stats.city_name)
+                self.service.weather_data.save(weather_result)
+                self.observe(city_key, weather_result)
+                results.append(weather_result)
+            except (
+                WeatherAPIClientError,
+                WeatherAPIDataManagerError,
+                WeatherAPIEndpointError,
+                DataParserError,
+                OSError,
+                ValueError,
+            ):
+                stats.errors += 1
+            finally:
+                self._schedule(stats, now + stats.interval * self.budget_factor)
+        return results
+
+    def run_forever(self, sleep: Callable[[float], None] = time.sleep) -> None:
+        """
+        Poll cities as they become due until no city is scheduled.
+
+        Args:
+            sleep (Callable): The function used to wait for the next due poll.
+        """
+        while True:
+            wait_time = self.seconds_until_next_poll()
+            if wait_time is None:
+                return
+            if wait_time:
+                sleep(wait_time)
+            self.run_pending()
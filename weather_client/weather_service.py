@@ -1,22 +1,62 @@
 """Module providing a service for interacting with the Weather API client."""
+import os
+import weakref
+from datetime import timedelta
+from types import TracebackType
+from typing import Optional, Type
+
 from weather_client.exceptions import WeatherServiceExceptionError
 from weather_client.weather_api_client import WeatherAPIClient
-from weather_client.weather_data_managers import ForecastResultManager, WeatherResultManager
+from weather_client.weather_data_managers import (
+    ForecastHistoryManager,
+    ForecastResultManager,
+    WeatherHistoryManager,
+    WeatherResultManager,
+)
+from weather_client.weather_data_managers.history_data_manager import BaseHistoryManager
 
 
 class WeatherService(object):
     """Handles weather-related operations and results."""
 
-    def __init__(self, api_client: WeatherAPIClient) -> None:
+    def __init__(
+            self,
+            api_client: WeatherAPIClient,
+            history_dir: str = '',
+            freshness_window: float = 0,
+            history_retention: Optional[timedelta] = None,
+    ) -> None:
         """
         Initialize the WeatherService.
 
         Args:
             api_client: An instance of the WeatherAPIClient class.
+            history_dir: The directory for the results history, empty to keep no history.
+            freshness_window: The number of seconds current weather from any response is reused, 0 to always request.
+                When set, forecast requests also save their current weather into `weather_data`.
+            history_retention: The max age of kept history, applied on close. None to keep everything.
         """
         self._api_client = api_client
-        self.weather_data = WeatherResultManager(self._api_client)
-        self.forecast_data = ForecastResultManager(self._api_client)
+        self.weather_history: Optional[WeatherHistoryManager] = None
+        self.forecast_history: Optional[ForecastHistoryManager] = None
+        if history_dir:
+            self.weather_history = WeatherHistoryManager(
+                os.path.join(history_dir, 'weather'), retention=history_retention,
+            )
+            self.forecast_history = ForecastHistoryManager(
+                os.path.join(history_dir, 'forecast'), retention=history_retention,
+            )
+        self._finalizer = weakref.finalize(self, _close_histories, self.weather_history, self.forecast_history)
+        self.weather_data = WeatherResultManager(
+            self._api_client,
+            history=self.weather_history,
+            freshness_window=freshness_window,
+        )
+        self.forecast_data = ForecastResultManager(
+            self._api_client,
+            history=self.forecast_history,
+            weather_manager=self.weather_data if freshness_window > 0 else None,
+        )
 
     @property
     def api_client(self) -> WeatherAPIClient:
@@ -29,3 +69,32 @@ class WeatherService(object):
         if not isinstance(api_client, WeatherAPIClient):
             raise WeatherServiceExceptionError('Invalid API client type. Expected: WeatherAPIClient')
         self._api_client = api_client
+
+    def close(self) -> None:
+        """Write the buffered history to disk and apply the history retention."""
+        _close_histories(self.weather_history, self.forecast_history)
+
+    def __enter__(self) -> 'WeatherService':
+        """Enter the runtime context of the service."""
+        return self
+
+    def __exit__(
+            self,
+            exc_type: Optional[Type[BaseException]],
+            exc_value: Optional[BaseException],
+            traceback: Optional[TracebackType],
+    ) -> None:
+        """Close the service on leaving the runtime context."""
+        self.close()
+
+
+def _close_histories(*histories: Optional[BaseHistoryManager]) -> None:
+    """
+    Close history managers. Also runs when the service is garbage collected or the interpreter exits.
+
+    Args:
+        histories (BaseHistoryManager): The history managers to close.
+    """
+    for history in histories:
+        if history:
+            history.close()